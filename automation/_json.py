@@ -0,0 +1,162 @@
+"""
+JSON helpers shared by the automation CLIs.
+
+Uses orjson when it is installed (pip install -e ".[fast]") and falls back
+to the stdlib json module otherwise. Both paths return identical Python
+objects; output is always UTF-8 text with non-ASCII characters preserved.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, List, Optional, TextIO, Union
+
+# Try to import orjson, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Files larger than this are memory-mapped instead of read into a bytes
+# object when orjson is available; below it the mmap setup cost dominates.
+MMAP_THRESHOLD = 64 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Parsed Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is read as bytes so orjson can parse it without an
+    intermediate decode step. With orjson, files above MMAP_THRESHOLD are
+    parsed straight from a read-only memory map, so no full-size copy of
+    the file is held alongside the parsed result.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+    """
+    with open(path, 'rb') as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def scan_json_files(directory: Union[str, Path]) -> List[os.DirEntry]:
+    """
+    List the *.json files directly inside a directory, sorted by name.
+
+    Uses a single os.scandir pass instead of Path.glob, so no Path object
+    is built per entry; use entry.name / entry.path for further access.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        os.DirEntry objects for the JSON files
+    """
+    with os.scandir(directory) as it:
+        files = [
+            entry for entry in it
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
+    files.sort(key=lambda entry: entry.name)
+    return files
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a JSON string (ensure_ascii=False semantics).
+
+    orjson only supports two-space indentation, so any other indent width
+    is handled by the stdlib encoder.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width, or None for compact output
+        sort_keys: Whether to sort dict keys
+
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        try:
+            return _orjson_dumps(obj, indent, sort_keys).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib handle it
+    return json.dumps(obj, ensure_ascii=False, indent=indent, sort_keys=sort_keys)
+
+
+def dump(obj: Any, fp: TextIO, indent: Optional[int] = None, sort_keys: bool = False) -> None:
+    """
+    Serialize an object as JSON into a text stream.
+
+    With orjson (indent None or 2) the document is encoded in one call and
+    written at once; otherwise the stdlib encoder streams it into fp chunk
+    by chunk without building the whole string.
+
+    Args:
+        obj: Object to serialize
+        fp: Writable text stream
+        indent: Indentation width, or None for compact output
+        sort_keys: Whether to sort dict keys
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        try:
+            fp.write(_orjson_dumps(obj, indent, sort_keys).decode('utf-8'))
+            return
+        except TypeError:
+            pass
+    json.dump(obj, fp, ensure_ascii=False, indent=indent, sort_keys=sort_keys)
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON bytes.
+
+    Useful for hashing: with orjson the bytes come straight from the
+    encoder without an intermediate str.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Whether to sort dict keys
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return _orjson_dumps(obj, None, sort_keys)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+
+def _orjson_dumps(obj: Any, indent: Optional[int], sort_keys: bool) -> bytes:
+    """Call orjson.dumps with options matching the stdlib arguments."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option)
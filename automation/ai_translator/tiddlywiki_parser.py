@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Extract comprehensive translation memory from TiddlyWiki for SWADE."""
 import json
+import mmap
 import os
 import re
 from pathlib import Path
 
+_DECODER = json.JSONDecoder()
+
 def find_tw_path():
     """Locate the TiddlyWiki HTML file."""
     script_dir = Path(__file__).resolve().parent
@@ -17,29 +20,22 @@ def find_tw_path():
     return None
 
 def load_tiddlers(tw_path):
-    """Load all tiddlers from TiddlyWiki HTML."""
+    """Load all tiddlers from TiddlyWiki HTML.
+
+    The wiki file is memory-mapped and only the tiddler store segment is
+    decoded, instead of reading and decoding the whole multi-MB page.
+    """
     with open(tw_path, "rb") as fh:
-        raw = fh.read()
-    text = raw.decode("utf-8", errors="replace")
-    
-    store_pos = text.find('class="tiddlywiki-tiddler-store"')
-    json_start = text.find("[", store_pos)
-    script_end = text.find("</script>", json_start)
-    segment = text[json_start:script_end]
-    
-    # String-aware bracket matching
-    depth = 0; in_string = False; escape = False; json_end = -1
-    for i, ch in enumerate(segment):
-        if escape: escape = False; continue
-        if ch == "\\": escape = True; continue
-        if ch == '"' and not escape: in_string = not in_string; continue
-        if in_string: continue
-        if ch == "[": depth += 1
-        elif ch == "]":
-            depth -= 1
-            if depth == 0: json_end = i; break
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            store_pos = mm.find(b'class="tiddlywiki-tiddler-store"')
+            json_start = mm.find(b"[", store_pos)
+            script_end = mm.find(b"</script>", json_start)
+            segment = mm[json_start:script_end].decode("utf-8", errors="replace")
     
-    return json.loads(segment[:json_end + 1])
+    # raw_decode parses the leading JSON array and stops at its closing
+    # bracket, so trailing markup before </script> is ignored
+    tiddlers, _ = _DECODER.raw_decode(segment)
+    return tiddlers
 
 def extract_from_titles(tiddlers):
     """Extract English→Chinese term pairs from bilingual titles.
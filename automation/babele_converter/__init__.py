@@ -6,6 +6,7 @@ from .converter import (
     translate_embedded_items,
     translate_journal_pages,
     find_translation_from_packs,
+    build_pack_index,
     TranslationCache,
 )
 
@@ -14,5 +15,6 @@ __all__ = [
     'translate_embedded_items',
     'translate_journal_pages',
     'find_translation_from_packs',
+    'build_pack_index',
     'TranslationCache',
 ]
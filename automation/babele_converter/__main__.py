@@ -15,15 +15,15 @@ Examples:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from .._json import dumps, load_file
 from .converter import (
     validate_translation_completeness,
-    translate_embedded_items,
-    find_translation_from_packs,
-    get_all_translatable_fields
+    count_compendium_reuse,
+    get_all_translatable_fields,
+    build_pack_index
 )
 
 
@@ -114,11 +114,8 @@ def validate_command(args):
         sys.exit(1)
     
     # Load files
-    with open(source_path, 'r', encoding='utf-8') as f:
-        source_data = json.load(f)
-    
-    with open(translated_path, 'r', encoding='utf-8') as f:
-        translated_data = json.load(f)
+    source_data = load_file(source_path)
+    translated_data = load_file(translated_path)
     
     # Validate each entry
     source_entries = source_data.get('entries', {})
@@ -151,7 +148,7 @@ def validate_command(args):
             },
             'results': all_results
         }
-        print(json.dumps(output, ensure_ascii=False, indent=2))
+        print(dumps(output, indent=2))
     else:
         # Text format
         total_entries = len(source_entries)
@@ -190,16 +187,15 @@ def test_reuse_command(args):
     
     # Load all JSON files as packs
     packs = []
-    for json_file in pack_dir.glob('*.json'):
+    for json_file in sorted(pack_dir.glob('*.json')):
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                packs.append({
-                    'name': json_file.stem,
-                    'path': str(json_file),
-                    'translated': True,
-                    'translations': data.get('entries', {})
-                })
+            data = load_file(json_file)
+            packs.append({
+                'name': json_file.stem,
+                'path': str(json_file),
+                'translated': True,
+                'translations': data.get('entries', {})
+            })
         except Exception as e:
             print(f"Warning: Could not load {json_file}: {e}", file=sys.stderr)
     
@@ -211,19 +207,14 @@ def test_reuse_command(args):
     for pack in packs:
         pack_name = pack['name']
         translations = pack['translations']
+        # Every entry in this pack reuses from the same set of other packs
+        pack_index = build_pack_index(packs, pack)
         
         for entry_name, entry_data in translations.items():
             # Look for embedded items
             items = entry_data.get('items', [])
             if items:
-                translated_items = translate_embedded_items(
-                    items, {}, packs, pack
-                )
-                
-                reused_count = sum(
-                    1 for item in translated_items 
-                    if item.get('_translationSource') == 'compendium-reuse'
-                )
+                reused_count = count_compendium_reuse(items, pack_index)
                 
                 if reused_count > 0:
                     if pack_name not in reuse_stats:
@@ -257,8 +248,7 @@ def fields_command(args):
         print(f"Error: File '{args.file}' does not exist", file=sys.stderr)
         sys.exit(1)
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_file(file_path)
     
     entries = data.get('entries', {})
     
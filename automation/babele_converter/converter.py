@@ -11,24 +11,35 @@ Implements:
 - Requirement 4.5: JournalEntry multi-page handling
 """
 
-from typing import Any, Dict, List, Optional, Union
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
-import copy
+
+
+# Field names considered translatable; interned so dict keys from parsed
+# JSON usually hit the identity fast path on membership tests
+_TRANSLATABLE_FIELDS = frozenset(map(sys.intern, (
+    'name', 'description', 'text', 'notes', 'biography', 'caption'
+)))
+
+# Default field set for translate_nested_content
+_NESTED_TRANSLATABLE_FIELDS = _TRANSLATABLE_FIELDS - {'caption'}
 
 
 @dataclass
 class TranslationCache:
     """Cache for translated items to enable reuse across compendiums."""
-    _cache: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _cache: Dict[Tuple[str, str], Any] = field(default_factory=dict)
     
     def get(self, item_type: str, item_name: str) -> Optional[Dict[str, Any]]:
         """Get cached translation for an item."""
-        cache_key = f"{item_type}:{item_name}"
+        cache_key = (item_type, item_name)
         return self._cache.get(cache_key)
     
     def set(self, item_type: str, item_name: str, translation: Dict[str, Any]) -> None:
         """Cache a translation for an item."""
-        cache_key = f"{item_type}:{item_name}"
+        cache_key = (item_type, item_name)
         self._cache[cache_key] = translation
     
     def clear(self) -> None:
@@ -37,7 +48,7 @@ class TranslationCache:
     
     def has(self, item_type: str, item_name: str) -> bool:
         """Check if a translation is cached."""
-        cache_key = f"{item_type}:{item_name}"
+        cache_key = (item_type, item_name)
         return cache_key in self._cache
 
 
@@ -45,6 +56,21 @@ class TranslationCache:
 _translation_cache = TranslationCache()
 
 
+def _json_clone(obj: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dict/list/str/int/float/bool/None).
+    
+    Much cheaper than copy.deepcopy for pack data since it skips the memo
+    dict and generic type dispatch. Immutable leaves are returned as-is.
+    """
+    t = type(obj)
+    if t is dict:
+        return {k: _json_clone(v) for k, v in obj.items()}
+    if t is list:
+        return [_json_clone(v) for v in obj]
+    return obj
+
+
 def safe_merge(original: Dict[str, Any], translation: Dict[str, Any]) -> Dict[str, Any]:
     """
     Safely merge translation into original object.
@@ -59,16 +85,16 @@ def safe_merge(original: Dict[str, Any], translation: Dict[str, Any]) -> Dict[st
     if not original:
         return translation or {}
     if not translation:
-        return copy.deepcopy(original)
+        return _json_clone(original)
     
-    result = copy.deepcopy(original)
+    result = _json_clone(original)
     
     for key, value in translation.items():
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
             # Recursively merge nested dicts
             result[key] = safe_merge(result[key], value)
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = _json_clone(value)
     
     return result
 
@@ -121,11 +147,61 @@ def find_translation_from_packs(
     return None
 
 
+def _pack_translation_maps(
+    packs: List[Dict[str, Any]],
+    exclude_pack: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Translation maps of the packs that take part in reuse, in priority order."""
+    return [
+        pack.get('translations', {}) for pack in packs
+        if pack is not exclude_pack and pack.get('translated', False)
+    ]
+
+
+def _find_in_translation_maps(
+    translation_maps: List[Dict[str, Any]],
+    item_name: str
+) -> Optional[Dict[str, Any]]:
+    """Return the translation from the first map that has item_name."""
+    for translations in translation_maps:
+        if item_name in translations:
+            return translations[item_name]
+    return None
+
+
+def build_pack_index(
+    packs: List[Dict[str, Any]],
+    exclude_pack: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge translations of all translated packs into a single name index.
+    
+    Earlier packs take priority, matching the scan order of
+    find_translation_from_packs.
+    
+    Args:
+        packs: List of translation packs
+        exclude_pack: Pack to leave out of the index
+        
+    Returns:
+        Dict mapping item name to translation
+    """
+    translation_maps = _pack_translation_maps(packs, exclude_pack)
+    
+    # Merge lowest priority first so earlier packs overwrite later ones;
+    # dict.update does the per-key work in C
+    index: Dict[str, Dict[str, Any]] = {}
+    for translations in reversed(translation_maps):
+        index.update(translations)
+    return index
+
+
 def translate_embedded_items(
     items: List[Dict[str, Any]],
     translations: Optional[Dict[str, Any]] = None,
     packs: Optional[List[Dict[str, Any]]] = None,
-    current_pack: Optional[Dict[str, Any]] = None
+    current_pack: Optional[Dict[str, Any]] = None,
+    pack_index: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> List[Dict[str, Any]]:
     """
     Translate embedded items within an actor or other container.
@@ -137,6 +213,8 @@ def translate_embedded_items(
         translations: Direct translations for these items (by ID or name)
         packs: List of translation packs for reuse lookup
         current_pack: Current pack to exclude from reuse search
+        pack_index: Prebuilt index from build_pack_index(packs, current_pack);
+            pass it when translating many containers against the same packs
         
     Returns:
         List of translated items
@@ -149,7 +227,18 @@ def translate_embedded_items(
     
     result = []
     translations = translations or {}
-    packs = packs or []
+    # Without a prebuilt index, look items up pack by pack: merging every
+    # pack into an index here would cost O(all translations) per call
+    if pack_index is None:
+        translation_maps = _pack_translation_maps(packs, current_pack) if packs else []
+    else:
+        translation_maps = [pack_index] if pack_index else []
+    
+    # Fast path: nothing can match, so every item is just copied
+    if not translations:
+        item_names = {item.get('name', '') for item in items if isinstance(item, dict)}
+        if all(item_names.isdisjoint(t) for t in translation_maps):
+            return [_json_clone(item) if isinstance(item, dict) else item for item in items]
     
     for item in items:
         if not isinstance(item, dict):
@@ -158,7 +247,6 @@ def translate_embedded_items(
         
         item_id = item.get('_id') or item.get('id')
         item_name = item.get('name', '')
-        item_type = item.get('type', '')
         
         translated_item = None
         
@@ -171,19 +259,43 @@ def translate_embedded_items(
             translated_item = safe_merge(item, translations[item_name])
         
         # Priority 3: Search in other translated compendiums for reuse
-        elif packs:
-            pack_translation = find_translation_from_packs(
-                item_name, item_type, packs, current_pack
-            )
+        elif translation_maps:
+            pack_translation = _find_in_translation_maps(translation_maps, item_name)
             if pack_translation:
                 translated_item = safe_merge(item, pack_translation)
                 translated_item['_translationSource'] = 'compendium-reuse'
         
-        result.append(translated_item if translated_item else copy.deepcopy(item))
+        result.append(translated_item if translated_item else _json_clone(item))
     
     return result
 
 
+def count_compendium_reuse(
+    items: List[Dict[str, Any]],
+    pack_index: Dict[str, Dict[str, Any]]
+) -> int:
+    """
+    Count embedded items that translate_embedded_items would reuse from packs.
+    
+    Equivalent to counting '_translationSource' == 'compendium-reuse' in
+    translate_embedded_items(items, {}, ..., pack_index=pack_index), without
+    cloning any items.
+    
+    Args:
+        items: Array of embedded items
+        pack_index: Index built by build_pack_index
+        
+    Returns:
+        Number of items with a reusable pack translation
+    """
+    if not items or not isinstance(items, list):
+        return 0
+    return sum(
+        1 for item in items
+        if isinstance(item, dict) and pack_index.get(item.get('name', ''))
+    )
+
+
 def translate_nested_content(
     obj: Any,
     translations: Optional[Dict[str, Any]] = None,
@@ -207,7 +319,7 @@ def translate_nested_content(
         Translated object (new copy, original unchanged)
     """
     if translatable_fields is None:
-        translatable_fields = ['name', 'description', 'text', 'notes', 'biography']
+        translatable_fields = _NESTED_TRANSLATABLE_FIELDS
     
     # Base cases
     if obj is None or depth > max_depth:
@@ -216,42 +328,38 @@ def translate_nested_content(
     if not isinstance(obj, (dict, list)):
         return obj
     
-    # Handle lists
-    if isinstance(obj, list):
-        return [
-            translate_nested_content(item, None, translatable_fields, depth + 1, max_depth)
-            for item in obj
-        ]
+    # Clone once, then only touch the branches that carry translations
+    result = _json_clone(obj)
+    if translations and isinstance(result, dict):
+        _apply_translations_inplace(result, translations, depth, max_depth)
     
-    # Handle dicts
-    result = {}
-    translations = translations or {}
+    return result
+
+
+def _apply_translations_inplace(
+    target: Dict[str, Any],
+    translations: Dict[str, Any],
+    depth: int,
+    max_depth: int
+) -> None:
+    """
+    Apply translations onto an already-cloned dict in place.
     
-    for key, value in obj.items():
-        # Check if this field has a direct translation
-        if key in translations:
-            trans_value = translations[key]
+    Only keys present in both target and translations are visited; nested
+    dicts are descended until max_depth, matching translate_nested_content.
+    Uses an explicit stack instead of recursion.
+    """
+    stack = [(target, translations, depth)]
+    while stack:
+        node, node_translations, node_depth = stack.pop()
+        for key in node_translations.keys() & node.keys():
+            trans_value = node_translations[key]
+            value = node[key]
             if isinstance(trans_value, dict) and isinstance(value, dict):
-                # Recursively translate nested objects
-                result[key] = translate_nested_content(
-                    value, trans_value, translatable_fields, depth + 1, max_depth
-                )
+                if node_depth + 1 <= max_depth:
+                    stack.append((value, trans_value, node_depth + 1))
             else:
-                result[key] = copy.deepcopy(trans_value)
-        elif isinstance(value, dict):
-            # Recursively process nested objects even without direct translation
-            result[key] = translate_nested_content(
-                value, None, translatable_fields, depth + 1, max_depth
-            )
-        elif isinstance(value, list):
-            # Process lists
-            result[key] = translate_nested_content(
-                value, None, translatable_fields, depth + 1, max_depth
-            )
-        else:
-            result[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
-    
-    return result
+                node[key] = _json_clone(trans_value)
 
 
 def translate_journal_pages(
@@ -268,7 +376,8 @@ def translate_journal_pages(
         translations: Translations object (keyed by page ID or name)
         
     Returns:
-        List of translated pages
+        List of translated pages (source pages are not modified; translated
+        pages share unmodified nested values with their source page)
     """
     if not pages:
         return []
@@ -291,11 +400,12 @@ def translate_journal_pages(
         translation = translations.get(page_id) or translations.get(page_name)
         
         if not translation:
-            result.append(copy.deepcopy(page))
+            result.append(_json_clone(page))
             continue
         
-        # Build the translated page object
-        translated_page = copy.deepcopy(page)
+        # Build the translated page object. Only the branches modified below
+        # are copied; large untouched payloads are shared with the source page.
+        translated_page = dict(page)
         translated_page['translated'] = True
         
         # Apply name translation
@@ -304,8 +414,7 @@ def translate_journal_pages(
         
         # Handle image caption if present
         if 'caption' in translation or (page.get('image') and 'caption' in page.get('image', {})):
-            if 'image' not in translated_page:
-                translated_page['image'] = {}
+            translated_page['image'] = dict(page.get('image') or {})
             translated_page['image']['caption'] = translation.get(
                 'caption', 
                 page.get('image', {}).get('caption', '')
@@ -317,11 +426,10 @@ def translate_journal_pages(
         
         # Handle text content - support both direct text and nested text.content
         if 'text' in translation:
-            if isinstance(page.get('text'), dict):
-                translated_page['text'] = {
-                    **page.get('text', {}),
-                    'content': translation['text']
-                }
+            page_text = page.get('text')
+            if isinstance(page_text, dict):
+                translated_page['text'] = dict(page_text)
+                translated_page['text']['content'] = translation['text']
             else:
                 translated_page['text'] = translation['text']
         
@@ -348,23 +456,34 @@ def translate_actions(
         return actions
     
     if not translations:
-        return copy.deepcopy(actions)
+        return _json_clone(actions)
     
-    result = copy.deepcopy(actions)
+    translate_skill = 'skill' in translations
+    translate_additional = 'additional' in actions and 'additional' in translations
+    
+    # Clone only the branches that are not rebuilt below; rebuilt keys get a
+    # placeholder so the original key order is kept
+    result = {}
+    for key, value in actions.items():
+        if (key == 'skill' and translate_skill) or (key == 'additional' and translate_additional):
+            result[key] = None
+        else:
+            result[key] = _json_clone(value)
     
     # Translate skill name
-    if 'skill' in translations:
+    if translate_skill:
         result['skill'] = translations['skill']
     
     # Translate additional actions
-    if 'additional' in actions and 'additional' in translations:
+    if translate_additional:
+        additional_translations = translations.get('additional', {})
         result['additional'] = {}
         for key, action in actions.get('additional', {}).items():
-            action_translation = translations.get('additional', {}).get(key)
+            action_translation = additional_translations.get(key)
             if action_translation:
                 result['additional'][key] = safe_merge(action, action_translation)
             else:
-                result['additional'][key] = copy.deepcopy(action)
+                result['additional'][key] = _json_clone(action)
     
     return result
 
@@ -382,25 +501,55 @@ def get_all_translatable_fields(obj: Dict[str, Any], path: str = "") -> List[str
     Returns:
         List of dot-separated paths to translatable fields
     """
-    translatable = ['name', 'description', 'text', 'notes', 'biography', 'caption']
-    paths = []
+    return [field_path for field_path, _ in get_translatable_field_parts(obj, path)]
+
+
+def get_translatable_field_parts(
+    obj: Dict[str, Any],
+    path: str = ""
+) -> List[Tuple[str, Tuple[Union[str, int], ...]]]:
+    """
+    Like get_all_translatable_fields, but pair each path with its parts.
     
+    The parts tuple can be passed straight to _get_nested_value, so callers
+    that look values up by path never have to re-parse the path string.
+    
+    Args:
+        obj: Object to analyze
+        path: Current path prefix
+        
+    Returns:
+        List of (dot-separated path, parts tuple) pairs
+    """
+    fields: List[Tuple[str, Tuple[Union[str, int], ...]]] = []
+    _collect_translatable_fields(obj, path, _compile_path(path), fields)
+    return fields
+
+
+def _collect_translatable_fields(
+    obj: Any,
+    path: str,
+    parts: Tuple[Union[str, int], ...],
+    fields: List[Tuple[str, Tuple[Union[str, int], ...]]]
+) -> None:
+    """Append (path, parts) pairs for every translatable field below obj."""
     if not isinstance(obj, dict):
-        return paths
+        return
     
     for key, value in obj.items():
         current_path = f"{path}.{key}" if path else key
+        current_parts = parts + (key,)
         
-        if key in translatable and isinstance(value, str):
-            paths.append(current_path)
+        if key in _TRANSLATABLE_FIELDS and isinstance(value, str):
+            fields.append((current_path, current_parts))
         elif isinstance(value, dict):
-            paths.extend(get_all_translatable_fields(value, current_path))
+            _collect_translatable_fields(value, current_path, current_parts, fields)
         elif isinstance(value, list):
             for i, item in enumerate(value):
                 if isinstance(item, dict):
-                    paths.extend(get_all_translatable_fields(item, f"{current_path}[{i}]"))
-    
-    return paths
+                    _collect_translatable_fields(
+                        item, f"{current_path}[{i}]", current_parts + (i,), fields
+                    )
 
 
 def validate_translation_completeness(
@@ -417,15 +566,16 @@ def validate_translation_completeness(
     Returns:
         Dict with 'complete' bool and 'missing' list of untranslated paths
     """
-    source_fields = set(get_all_translatable_fields(source))
-    translated_fields = set(get_all_translatable_fields(translated))
+    # Path -> pre-split parts, so lookups below skip path parsing
+    source_fields = dict(get_translatable_field_parts(source))
     
     # Check which fields are still in English (same as source)
     missing = []
-    for field_path in source_fields:
+    for field_path, parts in source_fields.items():
         # Get values at path
-        source_value = _get_nested_value(source, field_path)
-        translated_value = _get_nested_value(translated, field_path)
+        getter = _compile_getter(parts)
+        source_value = getter(source)
+        translated_value = getter(translated)
         
         if source_value == translated_value and source_value:
             missing.append(field_path)
@@ -438,16 +588,40 @@ def validate_translation_completeness(
     }
 
 
-def _get_nested_value(obj: Dict[str, Any], path: str) -> Any:
-    """Get a value from a nested dict using dot notation with array support."""
-    parts = path.replace('[', '.').replace(']', '').split('.')
+def _compile_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    Split a dot/bracket path into lookup parts.
+    
+    'items[0].name' becomes ('items', 0, 'name'); bracketed indices are
+    converted to int once here instead of on every lookup.
+    """
+    parts: List[Union[str, int]] = []
+    for segment in path.split('.'):
+        if '[' in segment:
+            name, *indices = segment.replace(']', '').split('[')
+            if name:
+                parts.append(name)
+            parts.extend(int(i) if i.isdigit() else i for i in indices if i)
+        elif segment:
+            parts.append(segment)
+    return tuple(parts)
+
+
+def _get_nested_value(
+    obj: Dict[str, Any],
+    path: Union[str, Tuple[Union[str, int], ...]]
+) -> Any:
+    """
+    Get a value from a nested dict using dot notation with array support.
+    
+    path may be a path string or a parts tuple from _compile_path.
+    """
+    parts = _compile_path(path) if isinstance(path, str) else path
     current = obj
     
     for part in parts:
-        if not part:
-            continue
         if isinstance(current, dict):
-            current = current.get(part)
+            current = current.get(part if isinstance(part, str) else str(part))
         elif isinstance(current, list):
             try:
                 current = current[int(part)]
@@ -460,3 +634,34 @@ def _get_nested_value(obj: Dict[str, Any], path: str) -> Any:
             return None
     
     return current
+
+
+@lru_cache(maxsize=4096)
+def _compile_getter(parts: Tuple[Union[str, int], ...]) -> Callable[[Any], Any]:
+    """
+    Build a specialized getter for a parts tuple from _compile_path.
+    
+    The generated function inlines the lookup chain, e.g. for
+    ('items', 0, 'name'):
+    
+        o = o.get('items'); o = o[0]; o = o.get('name')
+    
+    with a None check after each step. Whenever a container has an
+    unexpected type it defers to _get_nested_value, so results always match
+    the generic lookup.
+    """
+    lines = ["def getter(obj):", "    o = obj"]
+    for part in parts:
+        if isinstance(part, str):
+            lines.append("    if type(o) is not dict: return _slow(obj, parts)")
+            lines.append(f"    o = o.get({part!r})")
+        else:
+            lines.append("    if type(o) is not list: return _slow(obj, parts)")
+            lines.append(f"    if not -len(o) <= {part!r} < len(o): return None")
+            lines.append(f"    o = o[{part!r}]")
+        lines.append("    if o is None: return None")
+    lines.append("    return o")
+    
+    namespace = {'_slow': _get_nested_value, 'parts': parts}
+    exec("\n".join(lines), namespace)
+    return namespace['getter']
@@ -1,27 +1,92 @@
 """变更检测器实现"""
 
 import hashlib
+import io
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .._json import dumps_bytes, load_file, loads, scan_json_files
 from .models import ChangeReport
 
+# 优先使用 xxhash (非加密哈希，速度更快)，否则回退到标准库 blake2b
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+# 占位文件内容：等同于 json.dump({"entries": {}}, indent=4) 的输出
+_PLACEHOLDER_BYTES = b'{\n    "entries": {}\n}'
+
+# 条目没有 _meta 时使用的共享空字典 (只读)
+_EMPTY_META: Dict[str, Any] = {}
+
 
 class ChangeDetector:
     """检测 en-US 目录中的文件变更"""
     
-    def _compute_content_hash(self, content: Any) -> str:
+    def __init__(self):
+        # 目录列表缓存: 目录路径 -> (目录 mtime_ns, JSON 文件目录项列表)
+        self._dir_cache: Dict[str, tuple] = {}
+    
+    def _scan_json_dir(self, directory: Path) -> List[os.DirEntry]:
+        """列出目录中的 JSON 文件（按文件名排序），结果按目录 mtime 缓存
+        
+        同一个检测器先后执行 sync_placeholder_files 和 detect_changes 时，
+        源目录只需列出一次；目录中增删文件会更新其 mtime，缓存随之失效。
+        
+        Args:
+            directory: 目录路径
+            
+        Returns:
+            List[os.DirEntry]: JSON 文件目录项，调用方不应修改该列表
+        """
+        key = str(directory)
+        mtime_ns = os.stat(key).st_mtime_ns
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        json_files = scan_json_files(key)
+        self._dir_cache[key] = (mtime_ns, json_files)
+        return json_files
+    
+    def _compute_content_hash(self, content: Any) -> int:
         """计算内容的哈希值用于比较
         
+        哈希仅用于变更比较，不需要加密强度，因此使用 64 位非加密哈希。
+        
         Args:
             content: 要计算哈希的内容
             
         Returns:
-            str: 内容的 MD5 哈希值
+            int: 内容规范化字节的 64 位哈希值
         """
-        serialized = json.dumps(content, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(serialized.encode('utf-8')).hexdigest()
+        serialized = dumps_bytes(content, sort_keys=True)
+        if HAS_XXHASH:
+            return xxhash.xxh3_64_intdigest(serialized)
+        return int.from_bytes(hashlib.blake2b(serialized, digest_size=8).digest(), 'big')
+    
+    def _compute_entry_hashes(
+        self,
+        entries: Dict[str, Any],
+        keys: Optional[Iterable[str]] = None
+    ) -> Dict[str, int]:
+        """批量计算条目的内容哈希
+        
+        Args:
+            entries: 条目字典
+            keys: 需要计算哈希的条目名称，默认为全部条目
+            
+        Returns:
+            Dict[str, int]: 条目名称 -> 内容哈希
+        """
+        compute_hash = self._compute_content_hash
+        if keys is None:
+            return {key: compute_hash(value) for key, value in entries.items()}
+        return {key: compute_hash(entries[key]) for key in keys}
     
     def _load_json_file(self, file_path: str) -> Optional[Dict]:
         """加载 JSON 文件
@@ -32,11 +97,37 @@ class ChangeDetector:
         Returns:
             Optional[Dict]: JSON 内容，文件不存在时返回 None
         """
-        path = Path(file_path)
-        if not path.exists():
+        if not os.path.exists(file_path):
             return None
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_file(file_path)
+    
+    def _read_same_size_files(
+        self,
+        old_file: str,
+        new_file: str
+    ) -> Optional[Tuple[bytes, bytes]]:
+        """大小相同时读取两个文件的内容，供逐字节比较和解析共用
+        
+        先比较文件大小，大小不同时不读取文件内容。
+        
+        Args:
+            old_file: 旧文件路径
+            new_file: 新文件路径
+            
+        Returns:
+            Optional[Tuple[bytes, bytes]]: 两个文件都存在且大小相同时返回
+                (旧文件内容, 新文件内容)，否则返回 None
+        """
+        try:
+            if os.stat(old_file).st_size != os.stat(new_file).st_size:
+                return None
+            with open(old_file, 'rb') as f:
+                old_bytes = f.read()
+            with open(new_file, 'rb') as f:
+                new_bytes = f.read()
+        except OSError:
+            return None
+        return old_bytes, new_bytes
     
     def compare_entries(
         self, 
@@ -52,37 +143,24 @@ class ChangeDetector:
         Returns:
             ChangeReport: 变更报告
         """
-        added = []
-        modified = []
-        deleted = []
-        unchanged = []
-        
-        old_keys = set(old_entries.keys())
-        new_keys = set(new_entries.keys())
-        
-        # 新增的条目
-        for key in new_keys - old_keys:
-            added.append(key)
-        
-        # 删除的条目
-        for key in old_keys - new_keys:
-            deleted.append(key)
-        
-        # 检查修改和未变更的条目
-        for key in old_keys & new_keys:
-            old_hash = self._compute_content_hash(old_entries[key])
-            new_hash = self._compute_content_hash(new_entries[key])
-            if old_hash != new_hash:
-                modified.append(key)
-            else:
-                unchanged.append(key)
+        # dict 键视图直接支持集合运算，无需先构造 set
+        old_keys = old_entries.keys()
+        new_keys = new_entries.keys()
+        
+        # 检查修改和未变更的条目：每侧一次性批量计算共有条目的哈希
+        common_keys = old_keys & new_keys
+        old_hashes = self._compute_entry_hashes(old_entries, common_keys)
+        new_hashes = self._compute_entry_hashes(new_entries, common_keys)
+        modified = [key for key in common_keys if old_hashes[key] != new_hashes[key]]
+        unchanged = [key for key in common_keys if old_hashes[key] == new_hashes[key]]
         
         return ChangeReport(
             file_name="",  # Will be set by caller
-            added_entries=sorted(added),
+            added_entries=sorted(new_keys - old_keys),
             modified_entries=sorted(modified),
-            deleted_entries=sorted(deleted),
-            unchanged_entries=sorted(unchanged)
+            deleted_entries=sorted(old_keys - new_keys),
+            # 未变更条目只用于计数，不需要排序
+            unchanged_entries=unchanged
         )
     
     def compare_files(self, old_file: str, new_file: str) -> ChangeReport:
@@ -95,12 +173,28 @@ class ChangeDetector:
         Returns:
             ChangeReport: 变更报告
         """
-        old_data = self._load_json_file(old_file)
-        new_data = self._load_json_file(new_file)
-        
         # 提取文件名
         file_name = Path(new_file).name if new_file else Path(old_file).name
         
+        buffers = None
+        if old_file and new_file:
+            buffers = self._read_same_size_files(old_file, new_file)
+        if buffers is None:
+            # 空路径表示文件不存在 (detect_changes 在目标文件缺失时传入 "")
+            old_data = self._load_json_file(old_file) if old_file else None
+            new_data = self._load_json_file(new_file) if new_file else None
+        else:
+            # 直接解析已读入的内容，不再重复读取文件
+            old_bytes, new_bytes = buffers
+            new_data = loads(new_bytes)
+            # 文件逐字节相同时所有条目均未变更，只需解析一侧
+            if old_bytes == new_bytes and new_data is not None:
+                return ChangeReport(
+                    file_name=file_name,
+                    unchanged_entries=list(new_data.get("entries", {}))
+                )
+            old_data = loads(old_bytes)
+        
         # 处理文件不存在的情况
         if old_data is None and new_data is None:
             return ChangeReport(file_name=file_name)
@@ -132,26 +226,41 @@ class ChangeDetector:
         if not source_path.exists():
             return reports
         
-        for json_file in sorted(source_path.glob("*.json")):
+        for json_file in self._scan_json_dir(source_path):
             if target_dir:
-                old_file = Path(target_dir) / json_file.name
+                old_file = os.path.join(target_dir, json_file.name)
                 report = self.compare_files(
-                    str(old_file) if old_file.exists() else "",
-                    str(json_file)
+                    old_file if os.path.exists(old_file) else "",
+                    json_file.path
                 )
             else:
                 # 没有旧文件，所有条目都是新增的
-                new_data = self._load_json_file(str(json_file))
-                entries = new_data.get("entries", {}) if new_data else {}
                 report = ChangeReport(
                     file_name=json_file.name,
-                    added_entries=sorted(entries.keys())
+                    added_entries=sorted(self._load_entry_names(json_file.path))
                 )
             
             reports.append(report)
         
         return reports
     
+    def _load_entry_names(self, file_path: str) -> List[str]:
+        """只读取文件中的条目名称
+        
+        解析结果在取出键后立即释放，内存占用只保留条目名称。
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            List[str]: 条目名称，文件不存在时返回空列表
+        """
+        try:
+            data = load_file(file_path)
+        except OSError:
+            return []
+        return list(data.get("entries", {})) if data else []
+    
     def generate_changelog(self, changes: List[ChangeReport]) -> str:
         """生成人类可读的变更日志
         
@@ -163,61 +272,60 @@ class ChangeDetector:
         """
         from datetime import datetime
         
-        lines = []
-        lines.append("# 变更日志 (Changelog)")
-        lines.append("")
-        lines.append(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        
-        # 计算总体统计
-        total_added = sum(len(c.added_entries) for c in changes)
-        total_modified = sum(len(c.modified_entries) for c in changes)
-        total_deleted = sum(len(c.deleted_entries) for c in changes)
-        total_unchanged = sum(len(c.unchanged_entries) for c in changes)
-        
-        lines.append("## 总体统计")
-        lines.append("")
-        lines.append(f"- 新增条目: {total_added}")
-        lines.append(f"- 修改条目: {total_modified}")
-        lines.append(f"- 删除条目: {total_deleted}")
-        lines.append(f"- 未变更条目: {total_unchanged}")
-        lines.append("")
+        out = io.StringIO()
+        
+        def write_line(line: str = "") -> None:
+            out.write(line)
+            out.write("\n")
+        
+        write_line("# 变更日志 (Changelog)")
+        write_line()
+        write_line(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        write_line()
+        
+        # 计算总体统计 (单次遍历)，同时收集有变更的文件
+        total_added = total_modified = total_deleted = total_unchanged = 0
+        files_with_changes = []
+        for c in changes:
+            total_added += len(c.added_entries)
+            total_modified += len(c.modified_entries)
+            total_deleted += len(c.deleted_entries)
+            total_unchanged += len(c.unchanged_entries)
+            if c.has_changes:
+                files_with_changes.append(c)
+        
+        write_line("## 总体统计")
+        write_line()
+        write_line(f"- 新增条目: {total_added}")
+        write_line(f"- 修改条目: {total_modified}")
+        write_line(f"- 删除条目: {total_deleted}")
+        write_line(f"- 未变更条目: {total_unchanged}")
+        write_line()
+        
+        write_line("## 详细变更")
+        write_line()
         
         # 只显示有变更的文件
-        files_with_changes = [c for c in changes if c.has_changes]
-        
         if not files_with_changes:
-            lines.append("## 详细变更")
-            lines.append("")
-            lines.append("无变更。")
-            return "\n".join(lines)
-        
-        lines.append("## 详细变更")
-        lines.append("")
+            write_line("无变更。")
         
         for report in files_with_changes:
-            lines.append(f"### {report.file_name}")
-            lines.append("")
-            
-            if report.added_entries:
-                lines.append(f"**新增 ({len(report.added_entries)}):**")
-                for entry in report.added_entries:
-                    lines.append(f"- {entry}")
-                lines.append("")
+            write_line(f"### {report.file_name}")
+            write_line()
             
-            if report.modified_entries:
-                lines.append(f"**修改 ({len(report.modified_entries)}):**")
-                for entry in report.modified_entries:
-                    lines.append(f"- {entry}")
-                lines.append("")
-            
-            if report.deleted_entries:
-                lines.append(f"**删除 ({len(report.deleted_entries)}):**")
-                for entry in report.deleted_entries:
-                    lines.append(f"- {entry}")
-                lines.append("")
-        
-        return "\n".join(lines)
+            for title, entries in (
+                ("新增", report.added_entries),
+                ("修改", report.modified_entries),
+                ("删除", report.deleted_entries),
+            ):
+                if entries:
+                    write_line(f"**{title} ({len(entries)}):**")
+                    for entry in entries:
+                        write_line(f"- {entry}")
+                    write_line()
+        
+        # 与逐行 join 的结果保持一致：末尾不多出换行
+        return out.getvalue()[:-1]
 
     def create_placeholder_file(self, source_file: str, target_dir: str) -> Optional[Path]:
         """为源文件在目标目录创建占位翻译文件
@@ -241,16 +349,13 @@ class ChangeDetector:
         # 确保目标目录存在
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # 创建空的占位文件结构
-        placeholder_content = {
-            "entries": {}
-        }
-        
-        with open(target_path, 'w', encoding='utf-8') as f:
-            json.dump(placeholder_content, f, ensure_ascii=False, indent=4)
-        
+        self._write_placeholder_file(target_path)
         return target_path
     
+    def _write_placeholder_file(self, target_path: Path) -> None:
+        """写入空的占位文件结构 (不做存在性检查)"""
+        target_path.write_bytes(_PLACEHOLDER_BYTES)
+    
     def sync_placeholder_files(self, source_dir: str, target_dir: str) -> List[Path]:
         """同步源目录和目标目录，为缺失的文件创建占位文件
         
@@ -267,10 +372,28 @@ class ChangeDetector:
         if not source_path.exists():
             return created_files
         
-        for json_file in sorted(source_path.glob("*.json")):
-            result = self.create_placeholder_file(str(json_file), target_dir)
-            if result:
-                created_files.append(result)
+        # 一次性列出目标目录已有的文件名，避免对每个源文件单独 stat
+        try:
+            with os.scandir(target_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
+        
+        missing = [
+            json_file.name for json_file in self._scan_json_dir(source_path)
+            if json_file.name not in existing
+        ]
+        if not missing:
+            return created_files
+        
+        # 确保目标目录存在 (只需一次)
+        target_path = Path(target_dir)
+        target_path.mkdir(parents=True, exist_ok=True)
+        
+        for name in missing:
+            placeholder_path = target_path / name
+            self._write_placeholder_file(placeholder_path)
+            created_files.append(placeholder_path)
         
         return created_files
 
@@ -298,19 +421,24 @@ class ChangeDetector:
         
         entries = data.get("entries", {})
         
+        # 同一批次的条目共用一个时间戳
+        deprecated_meta = {
+            "deprecated": True,
+            "deprecated_at": datetime.now().isoformat()
+        }
+        
         for entry_name in deleted_entries:
             if entry_name in entries:
                 entry = entries[entry_name]
                 # 添加 _meta 字段标记为 deprecated
                 if "_meta" not in entry:
                     entry["_meta"] = {}
-                entry["_meta"]["deprecated"] = True
-                entry["_meta"]["deprecated_at"] = datetime.now().isoformat()
+                entry["_meta"].update(deprecated_meta)
         
         return data
     
     def save_json_file(self, file_path: str, data: Dict[str, Any]) -> None:
-        """保存 JSON 数据到文件
+        """保存 JSON 数据到文件 (原子写入)
         
         Args:
             file_path: 文件路径
@@ -319,8 +447,19 @@ class ChangeDetector:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        # 先完整序列化再一次性写入临时文件，最后原子替换：
+        # 读取方不会看到写了一半的文件，写入中断也不会损坏原文件
+        data_bytes = json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8')
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data_bytes)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     def apply_deleted_entry_marking(
         self, 
@@ -377,7 +516,7 @@ class ChangeDetector:
         Returns:
             bool: 是否被标记为 deprecated
         """
-        meta = entry.get("_meta", {})
+        meta = entry.get("_meta", _EMPTY_META)
         return meta.get("deprecated", False)
     
     def get_deprecated_entries(self, translation_file: str) -> List[str]:
@@ -393,11 +532,8 @@ class ChangeDetector:
         if data is None:
             return []
         
-        entries = data.get("entries", {})
-        deprecated = []
-        
-        for name, entry in entries.items():
-            if self.is_entry_deprecated(entry):
-                deprecated.append(name)
-        
-        return sorted(deprecated)
+        # 内联 is_entry_deprecated 的判断，避免逐条目的方法调用
+        return sorted(
+            name for name, entry in data.get("entries", {}).items()
+            if entry.get("_meta", _EMPTY_META).get("deprecated", False)
+        )
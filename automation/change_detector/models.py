@@ -1,10 +1,14 @@
 """变更检测数据模型"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List
 
+# 每个文件生成一个报告，使用 __slots__ 省去实例 __dict__ (dataclass 的 slots 参数需要 Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ChangeReport:
     """变更报告数据类"""
     
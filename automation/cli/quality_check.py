@@ -9,14 +9,26 @@ Usage:
 """
 
 import argparse
-import json
+import io
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+from automation._json import dumps, load_file, scan_json_files
 from automation.quality_checker import QualityChecker, Issue, QualityReport
 
 
+# 需要检查的条目字段
+CHECKED_FIELDS = ("name", "description", "category", "notes")
+
+# Markdown 报告中的严重程度图标（非 error 均显示为警告）
+SEVERITY_ICON = {"error": "❌", "warning": "⚠️"}
+
+
 def parse_args(args: List[str] = None) -> argparse.Namespace:
     """解析命令行参数"""
     parser = argparse.ArgumentParser(
@@ -69,6 +81,13 @@ def parse_args(args: List[str] = None) -> argparse.Namespace:
         help="输出文件路径 (默认: 标准输出)"
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="并行检查的进程数 (默认: CPU 核心数)"
+    )
+    
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -108,8 +127,7 @@ def load_glossary(glossary_path: str) -> Optional[Dict[str, str]]:
         return None
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_file(path)
         
         # 术语表格式: {"entries": {"English": "中文", ...}}
         if "entries" in data:
@@ -130,8 +148,7 @@ def load_translation_file(file_path: Path) -> Optional[Dict[str, Any]]:
         Dict: 翻译数据
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_file(file_path)
     except Exception as e:
         print(f"警告: 加载文件失败 {file_path}: {e}", file=sys.stderr)
         return None
@@ -140,7 +157,8 @@ def load_translation_file(file_path: Path) -> Optional[Dict[str, Any]]:
 def check_translation_pair(
     source_file: Path,
     target_file: Path,
-    glossary: Optional[Dict[str, str]] = None
+    glossary: Optional[Dict[str, str]] = None,
+    checker: Optional[QualityChecker] = None
 ) -> List[Issue]:
     """检查一对翻译文件
     
@@ -148,12 +166,14 @@ def check_translation_pair(
         source_file: 源文件路径
         target_file: 目标文件路径
         glossary: 术语表
+        checker: 复用的质量检查器（为空时新建）
         
     Returns:
         List[Issue]: 问题列表
     """
     issues = []
-    checker = QualityChecker()
+    if checker is None:
+        checker = QualityChecker()
     
     source_data = load_translation_file(source_file)
     target_data = load_translation_file(target_file)
@@ -172,11 +192,12 @@ def check_translation_pair(
             continue  # 未翻译的条目跳过
         
         # 检查各个字段
-        for field in ["name", "description", "category", "notes"]:
-            source_value = source_entry.get(field, "")
-            target_value = target_entry.get(field, "")
-            
-            if not source_value or not target_value:
+        for field in CHECKED_FIELDS:
+            source_value = source_entry.get(field)
+            if not source_value:
+                continue
+            target_value = target_entry.get(field)
+            if not target_value:
                 continue
             
             location = f"{source_file.name}:{entry_name}.{field}"
@@ -193,6 +214,60 @@ def check_translation_pair(
     return issues
 
 
+# 工作进程内的术语表与检查器（由 _init_worker 初始化，每个进程只创建一次）
+_worker_glossary: Optional[Dict[str, str]] = None
+_worker_checker: Optional[QualityChecker] = None
+
+
+def _init_worker(glossary: Optional[Dict[str, str]]) -> None:
+    """初始化工作进程：术语表只传输一次，检查器在进程内复用"""
+    global _worker_glossary, _worker_checker
+    _worker_glossary = glossary
+    _worker_checker = QualityChecker()
+
+
+def _check_pair_worker(pair: Tuple[Path, Path]) -> List[Issue]:
+    """在工作进程中检查一对翻译文件"""
+    source_file, target_file = pair
+    return check_translation_pair(source_file, target_file, _worker_glossary, _worker_checker)
+
+
+def check_translation_pairs(
+    pairs: List[Tuple[Path, Path]],
+    glossary: Optional[Dict[str, str]] = None,
+    jobs: Optional[int] = None
+) -> List[Issue]:
+    """检查多对翻译文件
+    
+    各文件对相互独立，且检查以正则匹配为主 (受 GIL 限制)，
+    因此使用进程池并行检查；只有一个进程或一个文件对时直接串行执行。
+    结果顺序与 pairs 一致。
+    
+    Args:
+        pairs: (源文件, 目标文件) 列表
+        glossary: 术语表
+        jobs: 进程数，默认为 CPU 核心数
+        
+    Returns:
+        List[Issue]: 问题列表
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(pairs))
+    
+    if workers <= 1:
+        checker = QualityChecker()
+        return list(chain.from_iterable(
+            check_translation_pair(source_file, target_file, glossary, checker)
+            for source_file, target_file in pairs
+        ))
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(glossary,)
+    ) as executor:
+        return list(chain.from_iterable(executor.map(_check_pair_worker, pairs)))
+
+
 def generate_report(
     issues: List[Issue],
     format: str = "text",
@@ -211,8 +286,13 @@ def generate_report(
     if error_only:
         issues = [i for i in issues if i.severity == "error"]
     
-    error_count = sum(1 for i in issues if i.severity == "error")
-    warning_count = sum(1 for i in issues if i.severity == "warning")
+    error_count = 0
+    warning_count = 0
+    for issue in issues:
+        if issue.severity == "error":
+            error_count += 1
+        elif issue.severity == "warning":
+            warning_count += 1
     
     if format == "json":
         report = {
@@ -231,41 +311,44 @@ def generate_report(
                 for i in issues
             ]
         }
-        return json.dumps(report, ensure_ascii=False, indent=2)
+        return dumps(report, indent=2)
     
     elif format == "markdown":
-        lines = [
-            "# 翻译质量检查报告",
-            "",
-            "## 摘要",
-            "",
-            f"- **总问题数**: {len(issues)}",
-            f"- **错误**: {error_count}",
-            f"- **警告**: {warning_count}",
-            ""
-        ]
+        out = io.StringIO()
+        
+        def write_line(line: str = "") -> None:
+            out.write(line)
+            out.write("\n")
+        
+        write_line("# 翻译质量检查报告")
+        write_line()
+        write_line("## 摘要")
+        write_line()
+        write_line(f"- **总问题数**: {len(issues)}")
+        write_line(f"- **错误**: {error_count}")
+        write_line(f"- **警告**: {warning_count}")
+        write_line()
         
         if issues:
-            lines.append("## 问题详情")
-            lines.append("")
+            write_line("## 问题详情")
+            write_line()
             
             # 按位置分组
-            by_location = {}
+            by_location = defaultdict(list)
             for issue in issues:
-                loc = issue.location
-                if loc not in by_location:
-                    by_location[loc] = []
-                by_location[loc].append(issue)
+                by_location[issue.location].append(issue)
             
-            for location, loc_issues in sorted(by_location.items()):
-                lines.append(f"### {location}")
-                lines.append("")
-                for issue in loc_issues:
-                    severity_icon = "❌" if issue.severity == "error" else "⚠️"
-                    lines.append(f"- {severity_icon} [{issue.type}] {issue.message}")
-                lines.append("")
+            warning_icon = SEVERITY_ICON["warning"]
+            for location in sorted(by_location):
+                write_line(f"### {location}")
+                write_line()
+                for issue in by_location[location]:
+                    severity_icon = SEVERITY_ICON.get(issue.severity, warning_icon)
+                    write_line(f"- {severity_icon} [{issue.type}] {issue.message}")
+                write_line()
         
-        return "\n".join(lines)
+        # 与逐行 join 的结果保持一致：末尾不多出换行
+        return out.getvalue()[:-1]
     
     else:  # text
         lines = [
@@ -312,19 +395,19 @@ def main(args: List[str] = None) -> int:
     # 加载术语表
     glossary = load_glossary(parsed.glossary) if parsed.glossary else None
     
-    all_issues = []
-    
     # 查找所有源文件
-    for source_file in sorted(source_dir.glob("*.json")):
-        target_file = target_dir / source_file.name
+    pairs = []
+    for source_entry in scan_json_files(source_dir):
+        target_file = target_dir / source_entry.name
         
         if not target_file.exists():
             if not parsed.quiet:
-                print(f"跳过: {source_file.name} (目标文件不存在)", file=sys.stderr)
+                print(f"跳过: {source_entry.name} (目标文件不存在)", file=sys.stderr)
             continue
         
-        issues = check_translation_pair(source_file, target_file, glossary)
-        all_issues.extend(issues)
+        pairs.append((Path(source_entry.path), target_file))
+    
+    all_issues = check_translation_pairs(pairs, glossary, parsed.jobs)
     
     # 生成报告
     report = generate_report(all_issues, parsed.format, parsed.error_only)
@@ -6,16 +6,7 @@
 - 翻译注入，保持 HTML 结构完整，保留原始链接
 """
 
-from .converter import (
-    FormatConverter,
-    ExtractedEntry,
-    HTMLTextExtractor,
-    LinkPlaceholderManager,
-    LinkInfo,
-    extract_for_translation,
-    extract_for_weblate,
-    inject_translations,
-)
+from importlib import import_module
 
 __all__ = [
     "FormatConverter",
@@ -27,3 +18,10 @@ __all__ = [
     "extract_for_weblate",
     "inject_translations",
 ]
+
+
+def __getattr__(name):
+    """按需导入 converter 模块，CLI 的 --help 和参数错误路径无需加载它"""
+    if name in __all__:
+        return getattr(import_module(".converter", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
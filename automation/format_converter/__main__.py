@@ -18,22 +18,163 @@ Examples:
 """
 
 import argparse
+import hashlib
+import os
+import pickle
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
-from .converter import FormatConverter
+# Write buffer for --output files; results are streamed into it
+OUTPUT_BUFFER_SIZE = 256 * 1024
 
+# Parsed translation files are cached here between inject --cache runs
+CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'format_converter'
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Convert between Babele JSON and translation formats (CSV/JSON)",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
+# Bump when the parsed translations format changes
+_CACHE_VERSION = b'1'
+
+# Bytes read from each end of a translations file for the cache key
+_CACHE_PROBE_SIZE = 4096
+
+# Cached parses kept in CACHE_DIR; the least recently used are pruned
+_CACHE_MAX_FILES = 32
+
+# Output directories already known to exist in this process
+_known_dirs = set()
+
+
+def _load_converter():
+    """Import the converter lazily so --help and usage errors stay cheap."""
+    from .converter import FormatConverter
+    return FormatConverter()
+
+
+def _write_stdout(result):
+    """
+    Print a whole result to stdout with a single binary write.
+
+    Bypasses the line-oriented text layer so large extracts piped to
+    another process are not split into many small writes. Falls back to
+    print() when stdout has no binary buffer or the platform translates
+    newlines.
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, 'buffer', None)
+    if buffer is None or os.linesep != '\n':
+        print(result)
+        return
+    stdout.flush()
+    buffer.write((result + '\n').encode(stdout.encoding, stdout.errors))
+    buffer.flush()
+
+
+def _ensure_dir(directory):
+    """Create directory if needed, checking each directory only once."""
+    if directory in _known_dirs:
+        return
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+    _known_dirs.add(directory)
+
+
+@contextmanager
+def _open_output(output_path):
+    """
+    Open an output file for streamed text output.
+
+    The converter writes into a sibling .tmp file which replaces
+    output_path only once the conversion succeeded, so a failed run
+    never leaves a truncated file behind.
+    """
+    _ensure_dir(output_path.parent)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='',
+                  buffering=OUTPUT_BUFFER_SIZE) as out:
+            yield out
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _translations_cache_key(path):
+    """
+    Build a cache key for a translations file.
+
+    Combines size, mtime and the first and last 4 KiB of the file, so
+    the key is cheap to compute even for large translation files.
+    """
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        head = f.read(_CACHE_PROBE_SIZE)
+        tail = b''
+        if stat.st_size > 2 * _CACHE_PROBE_SIZE:
+            f.seek(-_CACHE_PROBE_SIZE, os.SEEK_END)
+            tail = f.read()
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (_CACHE_VERSION, Path(path).suffix.lower().encode(),
+                 str(stat.st_size).encode(), str(stat.st_mtime_ns).encode(),
+                 head, tail):
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _prune_translations_cache():
+    """Delete all but the _CACHE_MAX_FILES most recently used cache files."""
+    try:
+        cached = [e for e in os.scandir(CACHE_DIR) if e.name.endswith('.pkl')]
+        cached.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        for entry in cached[_CACHE_MAX_FILES:]:
+            os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def _load_translations_cached(converter, translations_path):
+    """
+    Load a translations file, reusing the parse from a previous run.
+
+    Repeated inject --cache runs against the same CSV/JSON translations
+    file load a pickled copy of the parsed dict instead of re-parsing it.
+    Cache problems are never fatal: the file is simply parsed again.
+    """
+    key = _translations_cache_key(translations_path)
+    cache_path = CACHE_DIR / f'{key}.pkl'
+    try:
+        with open(cache_path, 'rb') as f:
+            translations = pickle.load(f)
+    except Exception:
+        # Missing, truncated or foreign cache files all mean: parse again
+        pass
+    else:
+        # Mark as recently used so pruning keeps it
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return translations
     
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    translations = converter.load_translations(translations_path)
     
-    # Extract command
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(translations, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    else:
+        _prune_translations_cache()
+    return translations
+
+
+def _add_extract_parser(subparsers):
     extract_parser = subparsers.add_parser(
         'extract', 
         help='Extract translatable text from Babele JSON (strips links and HTML)'
@@ -44,8 +185,13 @@ def main():
         '--format', choices=['csv', 'json'], default='csv',
         help='Output format (default: csv with UTF-8 BOM)'
     )
-    
-    # Inject command
+    extract_parser.add_argument(
+        '--jobs', '-j', type=int, default=1,
+        help='Worker processes for large files; 0 uses all CPUs (default: 1, serial)'
+    )
+
+
+def _add_inject_parser(subparsers):
     inject_parser = subparsers.add_parser(
         'inject',
         help='Inject translations back into Babele JSON (preserves original links)'
@@ -53,63 +199,107 @@ def main():
     inject_parser.add_argument('source', help='Source Babele JSON file')
     inject_parser.add_argument('translations', help='Translation file (CSV or JSON)')
     inject_parser.add_argument('--output', help='Output JSON file (default: stdout)')
+    inject_parser.add_argument(
+        '--cache', action='store_true',
+        help='Reuse the parsed translations file from earlier runs '
+             '(stored under $XDG_CACHE_HOME/format_converter)'
+    )
+
+
+_SUBPARSER_BUILDERS = {
+    'extract': _add_extract_parser,
+    'inject': _add_inject_parser,
+}
+
+
+def build_parser(argv):
+    """
+    Build the argument parser for the given command line.
+
+    Only the subparser for the requested command is built; the full
+    parser is built when no known command is given (e.g. for --help).
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert between Babele JSON and translation formats (CSV/JSON)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
     
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    command = argv[0] if argv else None
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in _SUBPARSER_BUILDERS.values():
+            add_parser(subparsers)
+    
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
-    converter = FormatConverter()
+    converter = _load_converter()
     
     try:
         if args.command == 'extract':
-            input_path = Path(args.input)
-            if not input_path.exists():
-                print(f"Error: Input file '{args.input}' does not exist",
-                      file=sys.stderr)
-                sys.exit(1)
-            
             print(f"Extracting from '{args.input}' in {args.format} format...",
                   file=sys.stderr)
             
-            result = converter.extract_for_translation(args.input, args.format)
-            
             if args.output:
-                output_path = Path(args.output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(result, encoding='utf-8')
+                with _open_output(Path(args.output)) as out:
+                    converter.extract_for_translation(args.input, args.format, out=out,
+                                                      jobs=args.jobs)
                 print(f"✓ Extracted to '{args.output}'", file=sys.stderr)
             else:
-                print(result)
+                result = converter.extract_for_translation(args.input, args.format,
+                                                            jobs=args.jobs)
+                _write_stdout(result)
                 
         elif args.command == 'inject':
-            source_path = Path(args.source)
-            if not source_path.exists():
-                print(f"Error: Source file '{args.source}' does not exist",
-                      file=sys.stderr)
-                sys.exit(1)
-                
-            trans_path = Path(args.translations)
-            if not trans_path.exists():
-                print(f"Error: Translation file '{args.translations}' does not exist",
-                      file=sys.stderr)
-                sys.exit(1)
-            
             print(f"Injecting translations from '{args.translations}' into "
                   f"'{args.source}'...", file=sys.stderr)
             
-            result = converter.inject_translations(
-                args.source, args.translations,
-                output_path=args.output
-            )
+            translations = None
+            if args.cache:
+                translations = _load_translations_cached(converter, args.translations)
             
-            if not args.output:
-                print(result)
-            else:
+            if args.output:
+                with _open_output(Path(args.output)) as out:
+                    converter.inject_translations(
+                        args.source, args.translations, out=out,
+                        translations=translations
+                    )
                 print(f"✓ Injected translations to '{args.output}'",
                       file=sys.stderr)
+            else:
+                result = converter.inject_translations(
+                    args.source, args.translations, translations=translations
+                )
+                _write_stdout(result)
                 
+    except FileNotFoundError as e:
+        # The converter opens the files itself; no separate exists() check
+        labels = {
+            getattr(args, 'input', None): 'Input file',
+            getattr(args, 'source', None): 'Source file',
+            getattr(args, 'translations', None): 'Translation file',
+        }
+        label = labels.get(str(e.filename)) if e.filename is not None else None
+        if label:
+            print(f"Error: {label} '{e.filename}' does not exist", file=sys.stderr)
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
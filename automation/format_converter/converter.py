@@ -12,17 +12,81 @@
 - 链接的翻译由 Link Post-Processor 在后处理阶段统一完成
 """
 
-import json
 import re
 import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import Dict, List, Optional, Tuple, Any
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Any
 from pathlib import Path
 from io import StringIO
 
-
-@dataclass
+from .._json import dump, dumps, load_file
+
+
+# 区分“键不存在”与值为 None 的哨兵
+_MISSING = object()
+
+# 条目数少于此值时串行提取，进程池启动和结果传输的开销高于收益
+PARALLEL_MIN_ENTRIES = 1000
+
+# 每个字段/链接生成一个实例，使用 __slots__ 省去实例 __dict__ (dataclass 的 slots 参数需要 Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 预编译的正则表达式（避免在逐条目的热路径上查找 re 模块缓存）
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_DOUBLE_SPACE_RE = re.compile(r'  +')
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+_OUTER_TAG_RE = re.compile(
+    r'^(\s*<(article|div|section|aside|main|header|footer)[^>]*>)'
+    r'(.*?)'
+    r'(</\2>\s*)$',
+    re.DOTALL | re.IGNORECASE
+)
+# _OUTER_TAG_RE 的开标签部分；闭标签只可能紧贴在末尾空白之前，
+# 直接定位比让 (.*?) 在每个位置尝试反向引用快得多
+_OUTER_OPEN_RE = re.compile(
+    r'\s*<(article|div|section|aside|main|header|footer)[^>]*>',
+    re.IGNORECASE
+)
+_P_SPLIT_RE = re.compile(r'(<p[^>]*>)(.*?)(</p>)', re.DOTALL)
+_PLACEHOLDER_RE = re.compile(r'\[\[LINK_\d+\]\]')
+_PLACEHOLDER_PREFIX = '[[LINK_'
+_LEADING_TAGS_RE = re.compile(r'^(\s*(?:<[^>]+>\s*)*)')
+_TRAILING_TAGS_RE = re.compile(r'((?:\s*<[^>]+>)*\s*)$')
+_TEXT_BETWEEN_TAGS_RE = re.compile(r'(?<=>)[^<]+(?=<)')
+_LEADING_TEXT_RE = re.compile(r'^[^<]+')
+_TRAILING_TEXT_RE = re.compile(r'[^>]+$')
+# 四种链接合并为一个模式：带 {文本} 的链接优先；
+# 后接 "{" 但文本为空的链接（如 @UUID[x]{}）不视为链接
+_LINK_RE = re.compile(
+    r'@(UUID|Compendium)\[([^\]]+)\](?:\{([^}]+)\}|(?!\{))'
+)
+_LINK_TYPES = {'UUID': 'uuid', 'Compendium': 'compendium'}
+# strip_links 返回的链接顺序：带文本的 uuid、compendium，再纯 uuid、compendium
+_LINK_ORDER = {('uuid', True): 0, ('compendium', True): 1,
+               ('uuid', False): 2, ('compendium', False): 3}
+# 简单 HTML 的词法单元：不含 < 和 & 的文本、属性规整的开始/结束标签。
+# 不匹配的内容（实体、注释、特殊属性等）交给完整的 HTMLParser 处理
+_SIMPLE_HTML_TOKEN_RE = re.compile(
+    r'([^<&]+)'
+    r'|<([a-zA-Z][a-zA-Z0-9]*)'
+    r'(?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*'
+    r'(?:\s*=\s*(?:"[^"<>]*"|\'[^\'<>]*\'|[^\s"\'=<>`/]+))?)*'
+    r'\s*(/?)>'
+    r'|</([a-zA-Z][a-zA-Z0-9]*)\s*>'
+)
+# HTMLParser 对这些标签的内容有特殊处理，不走快速路径
+_RAW_TEXT_TAGS = frozenset({'script', 'style', 'textarea', 'title', 'xmp',
+                            'iframe', 'noembed', 'noframes', 'noscript',
+                            'plaintext'})
+
+
+@dataclass(**_SLOTS)
 class LinkInfo:
     """链接元数据，用于后处理阶段"""
     type: str           # 'uuid' 或 'compendium'
@@ -32,7 +96,7 @@ class LinkInfo:
     position: int       # 在文本中的大致位置
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExtractedEntry:
     """提取的翻译条目"""
     key: str
@@ -51,27 +115,35 @@ class ExtractedEntry:
 class HTMLTextExtractor(HTMLParser):
     """HTML 解析器，提取纯文本并保留结构信息"""
 
+    # 类级别共享，避免每个字段创建解析器时重新构建集合
+    ignore_tags = frozenset({'script', 'style'})
+    block_tags = frozenset({'p', 'div', 'article', 'section', 'h1', 'h2', 'h3',
+                            'h4', 'h5', 'h6', 'li', 'tr', 'td', 'th'})
+
     def __init__(self):
         super().__init__()
         self.text_parts: List[str] = []
         self.tag_stack: List[str] = []
-        self.ignore_tags = {'script', 'style'}
-        self.block_tags = {'p', 'div', 'article', 'section', 'h1', 'h2', 'h3',
-                          'h4', 'h5', 'h6', 'li', 'tr', 'td', 'th'}
+        # tag_stack 中 ignore_tags 的数量，避免每段文本都扫描整个标签栈
+        self.ignored_depth = 0
 
     def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
         self.tag_stack.append(tag)
+        if tag in self.ignore_tags:
+            self.ignored_depth += 1
         if tag in self.block_tags and self.text_parts:
             self.text_parts.append('\n')
 
     def handle_endtag(self, tag: str):
         if self.tag_stack and self.tag_stack[-1] == tag:
             self.tag_stack.pop()
+            if tag in self.ignore_tags:
+                self.ignored_depth -= 1
         if tag in self.block_tags:
             self.text_parts.append('\n')
 
     def handle_data(self, data: str):
-        if not any(tag in self.tag_stack for tag in self.ignore_tags):
+        if not self.ignored_depth:
             cleaned = data.strip()
             if cleaned:
                 self.text_parts.append(cleaned)
@@ -87,7 +159,7 @@ class HTMLTextExtractor(HTMLParser):
             'ndash': '\u2013', 'shy': '',
         }
         char = entity_map.get(name, f'&{name};')
-        if not any(tag in self.tag_stack for tag in self.ignore_tags):
+        if not self.ignored_depth:
             self.text_parts.append(char)
 
     def handle_charref(self, name: str):
@@ -97,7 +169,7 @@ class HTMLTextExtractor(HTMLParser):
                 char = chr(int(name[1:], 16))
             else:
                 char = chr(int(name))
-            if not any(tag in self.tag_stack for tag in self.ignore_tags):
+            if not self.ignored_depth:
                 self.text_parts.append(char)
         except (ValueError, OverflowError):
             self.text_parts.append(f'&#{name};')
@@ -105,11 +177,96 @@ class HTMLTextExtractor(HTMLParser):
     def get_text(self) -> str:
         """获取提取的纯文本"""
         text = ''.join(self.text_parts)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        # 只替换两个及以上的连续空格；单个空格原样保留，无需逐个重建
+        text = _DOUBLE_SPACE_RE.sub(' ', text)
         return text.strip()
 
 
+@lru_cache(maxsize=4096)
+def _html_to_text(html_content: str) -> str:
+    """解析已剥离链接的 HTML 并返回纯文本
+
+    结果只取决于输入字符串，按内容缓存：Babele 条目中大量重复的
+    样板描述只解析一次。解析失败时退回到简单的标签剥离。
+    """
+    text = _simple_html_to_text(html_content)
+    if text is not None:
+        return text
+
+    extractor = HTMLTextExtractor()
+    try:
+        extractor.feed(html_content)
+    except Exception:
+        return _TAG_STRIP_RE.sub('', html_content).strip()
+    return extractor.get_text()
+
+
+def _simple_html_to_text(html_content: str) -> Optional[str]:
+    """简单 HTML 的快速路径
+
+    大部分字段只是 <p>/<strong> 等普通标签加纯文本。这里用一个正则切分
+    词法单元，直接调用 HTMLTextExtractor 的回调，结果与完整解析一致，
+    但省去 HTMLParser 逐个标签的状态机开销。遇到无法识别的内容返回
+    None，由调用方退回完整解析。
+    """
+    extractor = HTMLTextExtractor()
+    pos = 0
+    for match in _SIMPLE_HTML_TOKEN_RE.finditer(html_content):
+        if match.start() != pos:
+            return None
+        pos = match.end()
+        data, start_tag, self_closing, end_tag = match.groups()
+        if data is not None:
+            extractor.handle_data(data)
+        elif start_tag is not None:
+            tag = start_tag.lower()
+            if tag in _RAW_TEXT_TAGS:
+                return None
+            extractor.handle_starttag(tag, [])
+            if self_closing:
+                extractor.handle_endtag(tag)
+        else:
+            extractor.handle_endtag(end_tag.lower())
+    if pos != len(html_content):
+        return None
+    return extractor.get_text()
+
+
+def _match_outer_tag(html_content: str) -> Optional[Tuple[str, str, str, str]]:
+    """等价于 _OUTER_TAG_RE.match(...).groups()，不匹配时返回 None
+
+    闭标签后只能是空白，因此它的位置由 rstrip() 后的长度唯一确定。
+    """
+    opening = _OUTER_OPEN_RE.match(html_content)
+    if opening is None:
+        return None
+    tag = opening.group(1)
+    body_end = len(html_content.rstrip())
+    close_start = body_end - len(tag) - 3
+    if close_start < opening.end():
+        return None
+    closing = html_content[close_start:body_end]
+    if not (closing.isascii() and tag.isascii()):
+        # 非 ASCII 字符的大小写折叠规则不同，交给原正则
+        match = _OUTER_TAG_RE.match(html_content)
+        return match.groups() if match else None
+    if closing.lower() != f'</{tag.lower()}>':
+        return None
+    return (opening.group(0), tag, html_content[opening.end():close_start],
+            html_content[close_start:])
+
+
+@lru_cache(maxsize=2048)
+def _split_field_path(field_path: str) -> Tuple[Tuple[str, ...], str]:
+    """拆分嵌套字段路径：'actions.additional.X.name' → (('actions', 'additional', 'X'), 'name')
+
+    同一路径在各条目间反复出现，只拆分一次。
+    """
+    *parents, leaf = field_path.split('.')
+    return tuple(parents), leaf
+
+
 class LinkPlaceholderManager:
     """管理 UUID 和 Compendium 链接的占位符
 
@@ -118,13 +275,6 @@ class LinkPlaceholderManager:
     2. 剥离模式 (strip_links): 完全剥离链接，返回纯文本和链接元数据
     """
 
-    LINK_PATTERNS = {
-        'uuid_with_text': re.compile(r'@UUID\[([^\]]+)\]\{([^}]+)\}'),
-        'compendium_with_text': re.compile(r'@Compendium\[([^\]]+)\]\{([^}]+)\}'),
-        'uuid_plain': re.compile(r'@UUID\[([^\]]+)\](?!\{)'),
-        'compendium_plain': re.compile(r'@Compendium\[([^\]]+)\](?!\{)'),
-    }
-
     def __init__(self):
         self.placeholder_counter = 0
         self.placeholder_map: Dict[str, Dict[str, Any]] = {}
@@ -137,6 +287,8 @@ class LinkPlaceholderManager:
     def extract_links(self, content: str) -> Tuple[str, Dict[str, Dict[str, Any]]]:
         """提取链接并替换为占位符（用于注入阶段保留链接位置）
 
+        单次扫描，占位符按链接在内容中出现的顺序编号。
+
         Args:
             content: 包含链接的 HTML 内容
 
@@ -144,49 +296,23 @@ class LinkPlaceholderManager:
             (处理后的内容, 占位符映射)
         """
         self.reset()
-        processed = content
-
-        # 先处理带文本的链接
-        for pattern_name in ['uuid_with_text', 'compendium_with_text']:
-            pattern = self.LINK_PATTERNS[pattern_name]
-            matches = list(pattern.finditer(processed))
-            for match in reversed(matches):
-                full_match = match.group(0)
-                ref = match.group(1)
-                text = match.group(2)
-
-                placeholder = f"[[LINK_{self.placeholder_counter}]]"
-                self.placeholder_map[placeholder] = {
-                    'type': pattern_name.replace('_with_text', ''),
-                    'full': full_match,
-                    'ref': ref,
-                    'text': text,
-                    'has_text': True
-                }
-                processed = processed[:match.start()] + placeholder + processed[match.end():]
-                self.placeholder_counter += 1
-
-        # 再处理纯链接
-        for pattern_name in ['uuid_plain', 'compendium_plain']:
-            pattern = self.LINK_PATTERNS[pattern_name]
-            matches = list(pattern.finditer(processed))
-            for match in reversed(matches):
-                full_match = match.group(0)
-                ref = match.group(1)
-
-                placeholder = f"[[LINK_{self.placeholder_counter}]]"
-                self.placeholder_map[placeholder] = {
-                    'type': pattern_name.replace('_plain', ''),
-                    'full': full_match,
-                    'ref': ref,
-                    'text': '',
-                    'has_text': False
-                }
-                processed = processed[:match.start()] + placeholder + processed[match.end():]
-                self.placeholder_counter += 1
-
+        processed = _LINK_RE.sub(self._replace_link, content)
         return processed, self.placeholder_map
 
+    def _replace_link(self, match: re.Match) -> str:
+        """extract_links 的替换回调：登记链接并返回占位符"""
+        text = match.group(3)
+        placeholder = f"[[LINK_{self.placeholder_counter}]]"
+        self.placeholder_map[placeholder] = {
+            'type': _LINK_TYPES[match.group(1)],
+            'full': match.group(0),
+            'ref': match.group(2),
+            'text': text or '',
+            'has_text': text is not None
+        }
+        self.placeholder_counter += 1
+        return placeholder
+
     def strip_links(self, content: str) -> Tuple[str, List[LinkInfo]]:
         """从内容中完全剥离所有链接，返回纯文本和链接元数据
 
@@ -202,58 +328,54 @@ class LinkPlaceholderManager:
         Returns:
             (剥离链接后的文本, 链接信息列表)
         """
+        found = []
+
+        def remove(match):
+            found.append(match)
+            return ''
+
+        processed = _LINK_RE.sub(remove, content)
+
+        # 链接列表保持原有顺序：先带文本的链接，再纯链接，
+        # 同类链接按出现位置倒序
         links: List[LinkInfo] = []
-        processed = content
-
-        # 先处理带文本的链接
-        for pattern_name in ['uuid_with_text', 'compendium_with_text']:
-            pattern = self.LINK_PATTERNS[pattern_name]
-            matches = list(pattern.finditer(processed))
-            for match in reversed(matches):
-                link_type = 'uuid' if 'uuid' in pattern_name else 'compendium'
-                links.append(LinkInfo(
-                    type=link_type,
-                    ref=match.group(1),
-                    display_text=match.group(2),
-                    full_match=match.group(0),
-                    position=match.start()
-                ))
-                # 完全移除链接
-                processed = processed[:match.start()] + processed[match.end():]
-
-        # 再处理纯链接
-        for pattern_name in ['uuid_plain', 'compendium_plain']:
-            pattern = self.LINK_PATTERNS[pattern_name]
-            matches = list(pattern.finditer(processed))
-            for match in reversed(matches):
-                link_type = 'uuid' if 'uuid' in pattern_name else 'compendium'
-                links.append(LinkInfo(
-                    type=link_type,
-                    ref=match.group(1),
-                    display_text='',
-                    full_match=match.group(0),
-                    position=match.start()
-                ))
-                processed = processed[:match.start()] + processed[match.end():]
+        for match in found:
+            link_type = _LINK_TYPES[match.group(1)]
+            links.append(LinkInfo(
+                type=link_type,
+                ref=match.group(2),
+                display_text=match.group(3) or '',
+                full_match=match.group(0),
+                position=match.start()
+            ))
+        if len(links) > 1:
+            links.sort(key=lambda link: (
+                _LINK_ORDER[link.type, link.full_match.endswith('}')],
+                -link.position
+            ))
 
         # 清理多余空格
-        processed = re.sub(r'  +', ' ', processed)
+        processed = _DOUBLE_SPACE_RE.sub(' ', processed)
 
         return processed, links
 
     def restore_links(self, content: str, placeholder_map: Dict[str, Dict[str, Any]]) -> str:
-        """恢复占位符为原始链接"""
-        result = content
-        for placeholder, link_data in placeholder_map.items():
-            result = result.replace(placeholder, link_data['full'])
-        return result
+        """恢复占位符为原始链接
+
+        单次扫描替换所有占位符；不在映射中的占位符保持原样。
+        """
+        if not placeholder_map:
+            return content
+
+        def restore(match):
+            link_data = placeholder_map.get(match.group(0))
+            return link_data['full'] if link_data else match.group(0)
+
+        return _PLACEHOLDER_RE.sub(restore, content)
 
     def get_link_count(self, content: str) -> int:
         """统计内容中的链接数量"""
-        count = 0
-        for pattern in self.LINK_PATTERNS.values():
-            count += len(pattern.findall(content))
-        return count
+        return sum(1 for _ in _LINK_RE.finditer(content))
 
 
 class FormatConverter:
@@ -264,6 +386,8 @@ class FormatConverter:
     2. inject:  翻译后的 CSV + 源 HTML 结构 → 半成品 JSON (链接待后处理)
     """
 
+    __slots__ = ('link_manager', 'translatable_fields')
+
     def __init__(self):
         self.link_manager = LinkPlaceholderManager()
         self.translatable_fields = ['name', 'description', 'biography', 'text',
@@ -279,12 +403,7 @@ class FormatConverter:
             return ""
         # 先剥离链接，避免链接语法被当作文本
         stripped, _ = self.link_manager.strip_links(html_content)
-        extractor = HTMLTextExtractor()
-        try:
-            extractor.feed(stripped)
-        except Exception:
-            return re.sub(r'<[^>]+>', '', stripped).strip()
-        return extractor.get_text()
+        return _html_to_text(stripped)
 
     def strip_links(self, html_content: str) -> Tuple[str, List[LinkInfo]]:
         """从 HTML 内容中剥离所有链接，返回纯文本和链接元数据
@@ -298,26 +417,46 @@ class FormatConverter:
         """
         return self.link_manager.strip_links(html_content)
 
-    def extract_entries(self, babele_data: Dict) -> List[ExtractedEntry]:
+    def extract_entries(self, babele_data: Dict,
+                        jobs: Optional[int] = 1) -> List[ExtractedEntry]:
         """从 Babele JSON 数据中提取所有可翻译条目
 
         提取逻辑（链接剥离模式）：
         1. 完全剥离 @UUID 和 @Compendium 链接
         2. 剥离 HTML 标签，输出纯文本
         3. 链接显示文本收集为上下文信息
+
+        各条目相互独立，条目数达到 PARALLEL_MIN_ENTRIES 且 jobs > 1 时
+        分块交给进程池处理；结果顺序与串行一致。
+
+        Args:
+            babele_data: Babele JSON 数据字典
+            jobs: 进程数，None 表示 CPU 核心数；默认 1 (串行)
         """
-        entries = []
         babele_entries = babele_data.get('entries', {})
+        workers = min(jobs or os.cpu_count() or 1, len(babele_entries))
+
+        if workers <= 1 or len(babele_entries) < PARALLEL_MIN_ENTRIES:
+            return self._extract_items(babele_entries.items())
 
-        for key, value in babele_entries.items():
+        items = list(babele_entries.items())
+        chunk_size = -(-len(items) // workers)
+        chunks = [(self.translatable_fields, items[i:i + chunk_size])
+                  for i in range(0, len(items), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(chain.from_iterable(executor.map(_extract_chunk, chunks)))
+
+    def _extract_items(self, items: Iterable[Tuple[str, Any]]) -> List[ExtractedEntry]:
+        """串行提取一组 (key, value) 条目"""
+        entries = []
+
+        for key, value in items:
             if not isinstance(value, dict):
                 continue
 
+            # 按 translatable_fields 的顺序输出；缺失字段 get 返回 None，一次查找即可跳过
             for field_name in self.translatable_fields:
-                if field_name not in value:
-                    continue
-
-                field_value = value[field_name]
+                field_value = value.get(field_name)
                 if not field_value or not isinstance(field_value, str):
                     continue
 
@@ -332,12 +471,7 @@ class FormatConverter:
                 is_html = '<' in stripped_content and '>' in stripped_content
                 if is_html:
                     # stripped_content already has links removed, just parse HTML
-                    extractor = HTMLTextExtractor()
-                    try:
-                        extractor.feed(stripped_content)
-                        source_text = extractor.get_text()
-                    except Exception:
-                        source_text = re.sub(r'<[^>]+>', '', stripped_content).strip()
+                    source_text = _html_to_text(stripped_content)
                 else:
                     source_text = stripped_content.strip()
 
@@ -346,10 +480,13 @@ class FormatConverter:
                 if link_display_texts:
                     context += f" | Contains links: {', '.join(link_display_texts)}"
 
-                # 保留占位符映射（用于注入阶段）
-                _, placeholders = self.link_manager.extract_links(field_value)
-
                 if source_text:
+                    # 保留占位符映射（用于注入阶段）；
+                    # strip_links 未发现链接时无需再扫描一遍
+                    if link_infos:
+                        _, placeholders = self.link_manager.extract_links(field_value)
+                    else:
+                        placeholders = {}
                     entries.append(ExtractedEntry(
                         key=key,
                         field=field_name,
@@ -361,8 +498,9 @@ class FormatConverter:
                     ))
 
             # 处理嵌套的 actions 字段
-            if 'actions' in value and isinstance(value['actions'], dict):
-                self._extract_nested_actions(key, value['actions'], entries)
+            actions = value.get('actions')
+            if isinstance(actions, dict):
+                self._extract_nested_actions(key, actions, entries)
 
         return entries
 
@@ -388,34 +526,39 @@ class FormatConverter:
                         ))
 
     def extract_for_translation(self, babele_json_path: str,
-                                output_format: str = 'csv') -> str:
+                                output_format: str = 'csv',
+                                out: Optional[TextIO] = None,
+                                jobs: Optional[int] = 1) -> Optional[str]:
         """从 Babele JSON 提取纯文本，生成翻译者友好格式
 
         Args:
             babele_json_path: Babele JSON 文件路径
             output_format: 输出格式 ('csv' 或 'json')
+            out: 可选的文本输出流，提供时直接写入而不构建完整字符串
+                 （应以 newline='' 打开）
+            jobs: 提取条目的进程数，见 extract_entries
 
         Returns:
-            转换后的内容字符串
+            转换后的内容字符串；提供 out 时返回 None
         """
-        with open(babele_json_path, 'r', encoding='utf-8') as f:
-            babele_data = json.load(f)
+        babele_data = load_file(babele_json_path)
 
-        entries = self.extract_entries(babele_data)
+        entries = self.extract_entries(babele_data, jobs)
 
         if output_format == 'csv':
-            return self._to_csv_format(entries)
+            return self._to_csv_format(entries, out)
         elif output_format == 'json':
-            return self._to_json_format(entries)
+            return self._to_json_format(entries, out)
         else:
             raise ValueError(f"Unsupported output format: {output_format}. "
                            f"Use 'csv' or 'json'.")
 
     # Keep backward-compatible alias
     def extract_for_weblate(self, babele_json_path: str,
-                            output_format: str = 'csv') -> str:
+                            output_format: str = 'csv',
+                            out: Optional[TextIO] = None) -> Optional[str]:
         """向后兼容别名，调用 extract_for_translation"""
-        return self.extract_for_translation(babele_json_path, output_format)
+        return self.extract_for_translation(babele_json_path, output_format, out)
 
     def extract_from_data(self, babele_data: Dict,
                           output_format: str = 'csv') -> str:
@@ -439,14 +582,17 @@ class FormatConverter:
                            f"Use 'csv' or 'json'.")
 
 
-    def _to_csv_format(self, entries: List[ExtractedEntry]) -> str:
+    def _to_csv_format(self, entries: List[ExtractedEntry],
+                       out: Optional[TextIO] = None) -> Optional[str]:
         """转换为 CSV 格式（UTF-8 BOM，Excel/WPS 兼容）
 
         CSV 列: key, field, source_text, translated_text, context
         - source_text: 纯文本，无链接无HTML
         - context: 包含链接相关术语提示
+
+        提供 out 时逐行写入 out 并返回 None，否则返回完整字符串。
         """
-        output = StringIO()
+        output = StringIO() if out is None else out
         # UTF-8 BOM for Excel/WPS compatibility
         output.write('\ufeff')
         writer = csv.writer(output)
@@ -454,38 +600,44 @@ class FormatConverter:
         # 写入表头
         writer.writerow(['key', 'field', 'source_text', 'translated_text', 'context'])
 
-        for entry in entries:
-            writer.writerow([
-                entry.key,
-                entry.field,
-                entry.source_text,
-                '',  # 翻译文本为空
-                entry.context,
-            ])
-
-        return output.getvalue()
-
-    def _to_json_format(self, entries: List[ExtractedEntry]) -> str:
-        """转换为 JSON 格式"""
+        # 一次 writerows 调用写出全部行，逐行格式化在 C 层完成
+        writer.writerows(
+            (entry.key, entry.field, entry.source_text, '', entry.context)  # 翻译文本为空
+            for entry in entries
+        )
+
+        return output.getvalue() if out is None else None
+
+    def _to_json_format(self, entries: List[ExtractedEntry],
+                        out: Optional[TextIO] = None) -> Optional[str]:
+        """转换为 JSON 格式（提供 out 时直接写入 out 并返回 None）"""
+        grouped: Dict[str, Dict[str, Dict[str, str]]] = {}
         data = {
-            'entries': {}
+            'entries': grouped
         }
 
         for entry in entries:
-            if entry.key not in data['entries']:
-                data['entries'][entry.key] = {}
+            fields = grouped.get(entry.key)
+            if fields is None:
+                fields = grouped[entry.key] = {}
 
-            data['entries'][entry.key][entry.field] = {
+            fields[entry.field] = {
                 'source': entry.source_text,
                 'translation': '',
                 'source_html': entry.source_html,
                 'context': entry.context,
             }
 
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        if out is not None:
+            dump(data, out, indent=2)
+            return None
+        return dumps(data, indent=2)
 
     def inject_translations(self, source_json_path: str, translations_path: str,
-                           output_path: Optional[str] = None) -> str:
+                           output_path: Optional[str] = None,
+                           out: Optional[TextIO] = None,
+                           translations: Optional[Dict[str, Dict[str, str]]] = None
+                           ) -> Optional[str]:
         """将翻译注入回 Babele JSON 格式
 
         注入逻辑：将纯文本翻译注入回原始 HTML 结构，保留原始链接不变。
@@ -495,20 +647,28 @@ class FormatConverter:
             source_json_path: 源 JSON 文件路径
             translations_path: 翻译文件路径 (CSV 或 JSON)
             output_path: 输出文件路径（可选）
+            out: 可选的文本输出流，提供时直接写入而不构建完整字符串
+                 （优先于 output_path）
+            translations: 可选的已解析翻译字典 {key: {field: translation}}，
+                 提供时不再读取 translations_path
 
         Returns:
-            注入翻译后的 JSON 内容
+            注入翻译后的 JSON 内容；提供 out 时返回 None
         """
-        with open(source_json_path, 'r', encoding='utf-8') as f:
-            source_data = json.load(f)
+        source_data = load_file(source_json_path)
 
-        translations = self._load_translations(translations_path)
+        if translations is None:
+            translations = self.load_translations(translations_path)
         result = self.inject_translations_to_data(source_data, translations)
-        result_json = json.dumps(result, ensure_ascii=False, indent=4)
+
+        if out is not None:
+            dump(result, out, indent=4)
+            return None
+
+        result_json = dumps(result, indent=4)
 
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(result_json)
+            Path(output_path).write_bytes(result_json.encode('utf-8'))
 
         return result_json
 
@@ -523,16 +683,25 @@ class FormatConverter:
             translations: 翻译字典 {key: {field: translation}}
 
         Returns:
-            注入翻译后的数据
+            注入翻译后的数据。只复制被写入的条目及嵌套路径，
+            未修改的部分与 source_data 共享，source_data 本身不会被修改。
         """
-        result = json.loads(json.dumps(source_data))  # 深拷贝
-        entries = result.get('entries', {})
+        result = dict(source_data)
+        entries = result.get('entries')
+        if isinstance(entries, dict):
+            entries = result['entries'] = dict(entries)
+        else:
+            entries = {}
+        preserve_html_structure = self.preserve_html_structure
 
-        for key, entry_value in entries.items():
-            if key not in translations:
+        # 只遍历有翻译的条目，不逐条扫描整个源文件
+        for key, entry_translations in translations.items():
+            entry_value = entries.get(key, _MISSING)
+            if entry_value is _MISSING:
                 continue
-
-            entry_translations = translations[key]
+            if isinstance(entry_value, dict):
+                # 写入前复制条目（写时复制）
+                entry_value = entries[key] = dict(entry_value)
 
             for field_name, translated_text in entry_translations.items():
                 if not translated_text:
@@ -546,7 +715,7 @@ class FormatConverter:
 
                     if '<' in source_value and '>' in source_value:
                         # HTML 内容 - 保持结构注入翻译，保留原始链接
-                        entry_value[field_name] = self.preserve_html_structure(
+                        entry_value[field_name] = preserve_html_structure(
                             source_value, translated_text
                         )
                     else:
@@ -556,21 +725,32 @@ class FormatConverter:
         return result
 
     def _set_nested_field(self, obj: Dict, field_path: str, value: str):
-        """设置嵌套字段的值"""
-        parts = field_path.split('.')
+        """设置嵌套字段的值
+
+        obj 本身由调用方负责复制；路径上的嵌套字典在写入前逐层复制，
+        不会修改与源数据共享的对象。路径不存在时不做任何修改。
+        """
+        parents, leaf = _split_field_path(field_path)
+        path = [obj]
         current = obj
 
-        for part in parts[:-1]:
+        for part in parents:
             if part not in current:
                 return
             current = current[part]
             if not isinstance(current, dict):
                 return
+            path.append(current)
+
+        if leaf not in current:
+            return
 
-        if parts[-1] in current:
-            current[parts[-1]] = value
+        # 沿路径复制嵌套字典
+        for i in range(1, len(path)):
+            path[i] = path[i - 1][parents[i - 1]] = dict(path[i])
+        path[-1][leaf] = value
 
-    def _load_translations(self, translations_path: str) -> Dict[str, Dict[str, str]]:
+    def load_translations(self, translations_path: str) -> Dict[str, Dict[str, str]]:
         """加载翻译文件
 
         Args:
@@ -595,23 +775,36 @@ class FormatConverter:
         translations = {}
 
         with open(path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+            # 按列号读取，避免 DictReader 为每一行构建字典
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return translations
+
+            columns = {name: i for i, name in enumerate(header)}
+            if not {'key', 'field', 'translated_text'} <= columns.keys():
+                return translations
+            key_col = columns['key']
+            field_col = columns['field']
+            text_col = columns['translated_text']
+            min_len = max(key_col, field_col, text_col) + 1
+
             for row in reader:
-                key = row.get('key', '').strip()
-                field = row.get('field', '').strip()
-                translated = row.get('translated_text', '').strip()
+                if len(row) < min_len:
+                    continue  # 空行或缺列的行
+
+                key = row[key_col].strip()
+                field = row[field_col].strip()
+                translated = row[text_col].strip()
 
                 if key and field and translated:
-                    if key not in translations:
-                        translations[key] = {}
-                    translations[key][field] = translated
+                    translations.setdefault(key, {})[field] = translated
 
         return translations
 
     def _load_json_translations(self, path: str) -> Dict[str, Dict[str, str]]:
         """从 JSON 文件加载翻译"""
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_file(path)
 
         translations = {}
         entries = data.get('entries', data)
@@ -656,8 +849,11 @@ class FormatConverter:
         if '<' in translated_text and '>' in translated_text:
             return self._merge_html_with_links(source_html, translated_text)
 
-        # 1. 提取链接占位符
-        processed_source, placeholder_map = self.link_manager.extract_links(source_html)
+        # 1. 提取链接占位符（不含 @ 的内容不可能有链接，跳过扫描）
+        if '@' in source_html:
+            processed_source, placeholder_map = self.link_manager.extract_links(source_html)
+        else:
+            processed_source, placeholder_map = source_html, {}
 
         # 2. 分析源 HTML 结构（已替换链接为占位符）
         structure = self._analyze_html_structure(processed_source)
@@ -676,26 +872,24 @@ class FormatConverter:
 
     def _analyze_html_structure(self, html_content: str) -> Dict:
         """分析 HTML 结构，保留完整的外层标签"""
-        outer_match = re.match(
-            r'^(\s*<(article|div|section|aside|main|header|footer)[^>]*>)'
-            r'(.*?)'
-            r'(</\2>\s*)$',
-            html_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        outer_match = _match_outer_tag(html_content)
 
         if outer_match:
-            outer_opening = outer_match.group(1)
-            outer_tag = outer_match.group(2)
-            inner_content = outer_match.group(3)
-            outer_closing = outer_match.group(4)
+            outer_opening, outer_tag, inner_content, outer_closing = outer_match
         else:
             outer_opening = ''
             outer_tag = ''
             inner_content = html_content
             outer_closing = ''
 
-        paragraphs = re.findall(r'<p[^>]*>.*?</p>', inner_content, re.DOTALL)
+        # (开标签, 段落内容, 闭标签) 元组，注入时无需再逐段匹配
+        # 任何匹配都不会越过最后一个 </p>，只扫描到那里为止：
+        # 否则其后每个未闭合的 <p> 都会向后扫描到文本末尾（平方复杂度）
+        last_close = inner_content.rfind('</p>')
+        if last_close >= 0:
+            paragraphs = _P_SPLIT_RE.findall(inner_content, 0, last_close + 4)
+        else:
+            paragraphs = []
 
         return {
             'outer_opening': outer_opening,
@@ -743,9 +937,8 @@ class FormatConverter:
         保留占位符在原始位置，用翻译文本替换其余文本。
         """
         # 找出源内容中占位符的位置
-        placeholder_pattern = re.compile(r'\[\[LINK_\d+\]\]')
-        parts = placeholder_pattern.split(source_content)
-        placeholders_in_order = placeholder_pattern.findall(source_content)
+        parts = _PLACEHOLDER_RE.split(source_content)
+        placeholders_in_order = _PLACEHOLDER_RE.findall(source_content)
 
         if not placeholders_in_order:
             # 无占位符，直接返回翻译文本
@@ -796,16 +989,7 @@ class FormatConverter:
             source_paragraphs, placeholder_map
         )
 
-        for i, source_para in enumerate(source_paragraphs):
-            para_match = re.match(r'(<p[^>]*>)(.*?)(</p>)', source_para, re.DOTALL)
-            if not para_match:
-                result_paragraphs.append(source_para)
-                continue
-
-            opening_tag = para_match.group(1)
-            para_content = para_match.group(2)
-            closing_tag = para_match.group(3)
-
+        for i, (opening_tag, para_content, closing_tag) in enumerate(source_paragraphs):
             # 获取对应的翻译段落
             if i < len(translated_paragraphs):
                 trans_para = translated_paragraphs[i]
@@ -839,15 +1023,14 @@ class FormatConverter:
         策略：用占位符分割源段落，将翻译文本填入非占位符位置。
         占位符保持在原始相对位置。
         """
-        placeholder_pattern = re.compile(r'\[\[LINK_\d+\]\]')
         # 找出源段落中所有占位符的顺序
-        found_placeholders = placeholder_pattern.findall(source_para_content)
+        found_placeholders = _PLACEHOLDER_RE.findall(source_para_content)
 
         if not found_placeholders:
             return translated_text
 
         # 用占位符分割源段落，得到文本片段
-        text_parts = placeholder_pattern.split(source_para_content)
+        text_parts = _PLACEHOLDER_RE.split(source_para_content)
 
         # 将翻译文本按比例分配到文本片段位置
         # 简单策略：将整个翻译文本放在第一个非空文本位置
@@ -855,20 +1038,20 @@ class FormatConverter:
         text_placed = False
 
         for i, part in enumerate(text_parts):
-            stripped_part = re.sub(r'<[^>]+>', '', part).strip()
+            stripped_part = _TAG_STRIP_RE.sub('', part).strip()
             if not text_placed and stripped_part:
                 # 保留 part 中的 HTML 标签（如 <span>），替换文本
-                html_tags_before = re.match(r'^(\s*(?:<[^>]+>\s*)*)', part)
-                html_tags_after = re.search(r'((?:\s*<[^>]+>)*\s*)$', part)
+                html_tags_before = _LEADING_TAGS_RE.match(part)
+                html_tags_after = _TRAILING_TAGS_RE.search(part)
                 prefix = html_tags_before.group(1) if html_tags_before else ''
                 suffix = html_tags_after.group(1) if html_tags_after else ''
                 result_parts.append(f"{prefix}{translated_text}{suffix}")
                 text_placed = True
             elif text_placed:
                 # 保留 HTML 标签但清除文本
-                html_only = re.sub(r'(?<=>)[^<]+(?=<)', '', part)
-                html_only = re.sub(r'^[^<]+', '', html_only)
-                html_only = re.sub(r'[^>]+$', '', html_only)
+                html_only = _TEXT_BETWEEN_TAGS_RE.sub('', part)
+                html_only = _LEADING_TEXT_RE.sub('', html_only)
+                html_only = _TRAILING_TEXT_RE.sub('', html_only)
                 result_parts.append(html_only if html_only.strip() else '')
             else:
                 result_parts.append(part)
@@ -881,22 +1064,40 @@ class FormatConverter:
 
         return ''.join(result_parts)
 
-    def _assign_placeholders_to_paragraphs(self, source_paragraphs: List[str],
+    def _assign_placeholders_to_paragraphs(self, source_paragraphs: List[Tuple[str, str, str]],
                                            placeholder_map: Dict) -> Dict[int, List[str]]:
-        """将占位符分配到对应的段落"""
-        assignments: Dict[int, List[str]] = {}
+        """将占位符分配到对应的段落（段落为 (开标签, 内容, 闭标签) 元组）
+
+        每个段落只扫描一次，记录每个占位符出现的所有段落（含重复次数）；
+        各段落内的占位符保持 placeholder_map 中的顺序。
+        """
+        if not placeholder_map:
+            return {}
+
+        occurrences: Dict[str, List[int]] = {}
+        for i, (opening_tag, para_content, _) in enumerate(source_paragraphs):
+            # 大部分段落不含占位符，先用子串查找排除，不进入正则
+            if _PLACEHOLDER_PREFIX not in para_content and _PLACEHOLDER_PREFIX not in opening_tag:
+                continue
+            for placeholder in _PLACEHOLDER_RE.findall(opening_tag + para_content):
+                occurrences.setdefault(placeholder, []).append(i)
 
+        assignments: Dict[int, List[str]] = {}
         for placeholder in placeholder_map.keys():
-            for i, para in enumerate(source_paragraphs):
-                if placeholder in para:
-                    if i not in assignments:
-                        assignments[i] = []
-                    assignments[i].append(placeholder)
-                    break
+            for i in occurrences.get(placeholder, ()):
+                assignments.setdefault(i, []).append(placeholder)
 
         return assignments
 
 
+def _extract_chunk(chunk: Tuple[List[str], List[Tuple[str, Any]]]) -> List[ExtractedEntry]:
+    """在工作进程中提取一块条目"""
+    translatable_fields, items = chunk
+    converter = FormatConverter()
+    converter.translatable_fields = translatable_fields
+    return converter._extract_items(items)
+
+
 # 便捷函数
 def extract_for_translation(babele_json_path: str,
                             output_format: str = 'csv') -> str:
@@ -1,5 +1,12 @@
 """术语管理模块 - 管理术语表，确保翻译一致性"""
 
-from .manager import GlossaryManager
+from importlib import import_module
 
 __all__ = ["GlossaryManager"]
+
+
+def __getattr__(name):
+    """按需导入 manager 模块，CLI 的 --help 和参数错误路径无需加载它"""
+    if name in __all__:
+        return getattr(import_module(".manager", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -30,19 +30,14 @@ import argparse
 import sys
 from pathlib import Path
 
-from .manager import GlossaryManager
 
+def _load_manager(glossary_path):
+    """Import the glossary manager lazily so --help and usage errors stay cheap."""
+    from .manager import GlossaryManager
+    return GlossaryManager(glossary_path)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Manage translation glossaries and apply term translations",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Apply command
+
+def _add_apply_parser(subparsers):
     apply_parser = subparsers.add_parser(
         'apply',
         help='Apply glossary terms to text'
@@ -64,8 +59,9 @@ def main():
         action='store_true',
         help='Show replacement statistics'
     )
-    
-    # Find missing command
+
+
+def _add_find_missing_parser(subparsers):
     missing_parser = subparsers.add_parser(
         'find-missing',
         help='Find missing terms in text'
@@ -88,8 +84,9 @@ def main():
         '--output',
         help='Output file (default: stdout)'
     )
-    
-    # Update command
+
+
+def _add_update_parser(subparsers):
     update_parser = subparsers.add_parser(
         'update',
         help='Update a term in glossary'
@@ -110,8 +107,9 @@ def main():
         '--sync-translations',
         help='Directory containing translation files to update'
     )
-    
-    # Export command
+
+
+def _add_export_parser(subparsers):
     export_parser = subparsers.add_parser(
         'export',
         help='Export glossary to different formats'
@@ -130,8 +128,9 @@ def main():
         default='json',
         help='Output format (default: json)'
     )
-    
-    # Import command
+
+
+def _add_import_parser(subparsers):
     import_parser = subparsers.add_parser(
         'import',
         help='Import terms from file'
@@ -149,8 +148,9 @@ def main():
         action='store_true',
         help='Merge with existing glossary (default: replace)'
     )
-    
-    # List command
+
+
+def _add_list_parser(subparsers):
     list_parser = subparsers.add_parser(
         'list',
         help='List all terms in glossary'
@@ -163,27 +163,56 @@ def main():
         '--filter',
         help='Filter terms containing this text'
     )
+
+
+_SUBPARSER_BUILDERS = {
+    'apply': _add_apply_parser,
+    'find-missing': _add_find_missing_parser,
+    'update': _add_update_parser,
+    'export': _add_export_parser,
+    'import': _add_import_parser,
+    'list': _add_list_parser,
+}
+
+
+def build_parser(argv):
+    """
+    Build the argument parser for the given command line.
+
+    Only the subparser for the requested command is built; the full
+    parser is built when no known command is given (e.g. for --help).
+    """
+    parser = argparse.ArgumentParser(
+        description="Manage translation glossaries and apply term translations",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    command = argv[0] if argv else None
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in _SUBPARSER_BUILDERS.values():
+            add_parser(subparsers)
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
     try:
-        if args.command == 'apply':
-            apply_command(args)
-        elif args.command == 'find-missing':
-            find_missing_command(args)
-        elif args.command == 'update':
-            update_command(args)
-        elif args.command == 'export':
-            export_command(args)
-        elif args.command == 'import':
-            import_command(args)
-        elif args.command == 'list':
-            list_command(args)
-            
+        _COMMANDS[args.command](args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -202,7 +231,7 @@ def apply_command(args):
         print(f"Error: Text file '{args.text_file}' does not exist", file=sys.stderr)
         sys.exit(1)
     
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     
     # Read input text
     text = text_path.read_text(encoding='utf-8')
@@ -247,7 +276,7 @@ def find_missing_command(args):
         print(f"Error: Text file '{args.text_file}' does not exist", file=sys.stderr)
         sys.exit(1)
     
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     text = text_path.read_text(encoding='utf-8')
     
     print(f"Analyzing '{args.text_file}' for missing terms...", file=sys.stderr)
@@ -257,11 +286,11 @@ def find_missing_command(args):
     if args.format == 'markdown':
         output = manager.generate_missing_terms_report(text)
     elif args.format == 'json':
-        import json
-        output = json.dumps({
+        from .._json import dumps
+        output = dumps({
             'missing_terms': missing_terms,
             'count': len(missing_terms)
-        }, ensure_ascii=False, indent=2)
+        }, indent=2)
     else:
         # Text format
         if missing_terms:
@@ -286,7 +315,7 @@ def find_missing_command(args):
 
 def update_command(args):
     """Update a term in glossary"""
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     
     old_translation = manager.get_translation(args.term)
     
@@ -322,7 +351,7 @@ def update_command(args):
 
 def export_command(args):
     """Export glossary to different formats"""
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     
     print(f"Exporting {len(manager)} terms to '{args.output}' in {args.format} format...", file=sys.stderr)
     
@@ -333,7 +362,7 @@ def export_command(args):
 
 def import_command(args):
     """Import terms from file"""
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     
     original_count = len(manager)
     
@@ -349,7 +378,7 @@ def import_command(args):
 
 def list_command(args):
     """List all terms in glossary"""
-    manager = GlossaryManager(args.glossary)
+    manager = _load_manager(args.glossary)
     
     all_terms = manager.get_all_terms()
     
@@ -370,5 +399,15 @@ def list_command(args):
         print(f"  {term} -> {translation}")
 
 
+_COMMANDS = {
+    'apply': apply_command,
+    'find-missing': find_missing_command,
+    'update': update_command,
+    'export': export_command,
+    'import': import_command,
+    'list': list_command,
+}
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
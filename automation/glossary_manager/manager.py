@@ -2,10 +2,13 @@
 
 import json
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+from .._json import dump, load_file
+
 
 @dataclass
 class GlossaryUpdateResult:
@@ -15,12 +18,51 @@ class GlossaryUpdateResult:
     errors: List[str] = field(default_factory=list)
 
 
+def _build_term_regex(terms: List[str]) -> str:
+    """把术语列表构建为按前缀树组织的正则表达式
+    
+    平铺的 "a|b|c" 在每个位置都要逐个尝试全部术语；按前缀合并后，
+    每个位置只需沿着与文本相符的分支向下匹配，效果接近 DFA。
+    更长的延续分支总是先于"在此结束"被尝试，因此同一位置上仍是长术语优先。
+    
+    Args:
+        terms: 术语列表
+        
+    Returns:
+        str: 不含单词边界的正则表达式（需配合 re.IGNORECASE 使用）
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term.lower():
+            node = node.setdefault(char, {})
+        node[''] = {}  # 术语结束标记
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        if '' in node:
+            return f"(?:{'|'.join(branches)})?"
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+    
+    return build(trie)
+
+
 class GlossaryManager:
     """管理翻译术语表
     
     负责加载术语表、应用术语替换、检测未知术语和更新术语表。
     """
     
+    __slots__ = ('glossary_path', 'glossary', '_sorted_terms', '_pattern', '_lower_terms',
+                 '_lowered_items', '_suggestion_cache')
+    
     def __init__(self, glossary_path: str):
         """初始化术语管理器
         
@@ -30,6 +72,10 @@ class GlossaryManager:
         self.glossary_path = Path(glossary_path)
         self.glossary: Dict[str, str] = {}
         self._sorted_terms: List[str] = []  # 按长度降序排列的术语列表
+        self._pattern: Optional[re.Pattern] = None  # 所有术语合并后的正则，按需编译
+        self._lower_terms: Optional[Dict[str, str]] = None  # 小写术语 -> 术语表键，按需构建
+        self._lowered_items: Optional[List[Tuple[str, str, str]]] = None  # 供建议查找，按需构建
+        self._suggestion_cache: Dict[str, List[str]] = {}  # 小写术语 -> 翻译建议
         self._load_glossary()
     
     def _load_glossary(self) -> None:
@@ -40,20 +86,28 @@ class GlossaryManager:
         if not self.glossary_path.exists():
             self.glossary = {}
             self._sorted_terms = []
+            self._clear_caches()
             return
         
         try:
-            with open(self.glossary_path, 'r', encoding='utf-8') as f:
-                self.glossary = json.load(f)
+            self.glossary = load_file(self.glossary_path)
             # 按术语长度降序排列，确保长术语优先匹配
             self._sorted_terms = sorted(
                 self.glossary.keys(), 
                 key=len, 
                 reverse=True
             )
+            self._clear_caches()
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in glossary file: {e}")
     
+    def _clear_caches(self) -> None:
+        """清除由术语表派生的缓存，术语表变化后调用"""
+        self._pattern = None
+        self._lower_terms = None
+        self._lowered_items = None
+        self._suggestion_cache = {}
+    
     def reload(self) -> None:
         """重新加载术语表"""
         self._load_glossary()
@@ -94,10 +148,9 @@ class GlossaryManager:
             return self.glossary[english_display]
 
         # 2. 忽略大小写匹配
-        display_lower = english_display.lower()
-        for term, translation in self.glossary.items():
-            if term.lower() == display_lower:
-                return translation
+        term = self._get_lower_terms().get(english_display.lower())
+        if term is not None:
+            return self.glossary[term]
 
         return None
 
@@ -125,10 +178,9 @@ class GlossaryManager:
             return self.glossary[english_name]
 
         # 2. 忽略大小写匹配
-        name_lower = english_name.lower()
-        for term, translation in self.glossary.items():
-            if term.lower() == name_lower:
-                return translation
+        term = self._get_lower_terms().get(english_name.lower())
+        if term is not None:
+            return self.glossary[term]
 
         return None
 
@@ -150,19 +202,62 @@ class GlossaryManager:
         if not text or not self.glossary:
             return text
         
-        result = text
+        return self._get_pattern().sub(self._replace_term, text)
+    
+    def _get_pattern(self) -> re.Pattern:
+        """获取合并所有术语的正则表达式
         
-        # 按长度降序处理术语，确保长术语优先匹配
-        for term in self._sorted_terms:
-            translation = self.glossary[term]
-            # 使用单词边界匹配，支持大小写不敏感
-            # 注意：对于包含特殊字符的术语（如 "/"），需要转义
-            escaped_term = re.escape(term)
-            # 使用单词边界，但对于非字母数字字符的边界需要特殊处理
-            pattern = rf'\b{escaped_term}\b'
-            result = re.sub(pattern, translation, result, flags=re.IGNORECASE)
+        术语按前缀树合并（见 _build_term_regex），同一位置上长术语优先匹配。
+        编译结果会被缓存，术语表变化时失效。
         
-        return result
+        Returns:
+            re.Pattern: 所有术语组成的大小写不敏感正则（带单词边界）
+        """
+        if self._pattern is None:
+            alternatives = _build_term_regex(self._sorted_terms)
+            self._pattern = re.compile(rf'\b(?:{alternatives})\b', re.IGNORECASE)
+        return self._pattern
+    
+    def _get_lower_terms(self) -> Dict[str, str]:
+        """获取小写术语到术语表键的索引，用于大小写不敏感查找
+        
+        Returns:
+            Dict[str, str]: 小写术语 -> 术语表键（缓存，术语表变化时失效）
+        """
+        if self._lower_terms is None:
+            # 小写形式相同的术语以排序靠前者为准，与逐个替换时先替换者胜出一致
+            self._lower_terms = {}
+            for term in self._sorted_terms:
+                self._lower_terms.setdefault(term.lower(), term)
+        return self._lower_terms
+    
+    def _get_lowered_items(self) -> List[Tuple[str, str, str]]:
+        """获取 (小写术语, 术语, 翻译) 列表，保持术语表原有顺序
+        
+        Returns:
+            List[Tuple[str, str, str]]: 缓存的列表，术语表变化时失效
+        """
+        if self._lowered_items is None:
+            self._lowered_items = [
+                (term.lower(), term, translation)
+                for term, translation in self.glossary.items()
+            ]
+        return self._lowered_items
+    
+    def _match_term(self, matched: str) -> str:
+        """找出正则匹配到的文本对应的术语表键"""
+        term = self._get_lower_terms().get(matched.lower())
+        if term is not None:
+            return term
+        # 少数字符（如 "ſ"）在忽略大小写匹配时等价，但 lower() 后不同
+        for term in self._sorted_terms:
+            if re.fullmatch(re.escape(term), matched, flags=re.IGNORECASE):
+                return term
+        raise KeyError(matched)
+    
+    def _replace_term(self, match: 're.Match[str]') -> str:
+        """re.sub 回调：返回匹配术语的译文"""
+        return self.glossary[self._match_term(match.group(0))]
     
     def apply_glossary_with_tracking(self, text: str) -> Tuple[str, Dict[str, int]]:
         """应用术语表并追踪替换情况
@@ -176,21 +271,23 @@ class GlossaryManager:
         if not text or not self.glossary:
             return text, {}
         
-        result = text
-        replacements: Dict[str, int] = {}
+        matched_terms: List[str] = []
         
-        for term in self._sorted_terms:
-            translation = self.glossary[term]
-            escaped_term = re.escape(term)
-            pattern = rf'\b{escaped_term}\b'
-            
-            # 计算匹配次数
-            matches = re.findall(pattern, result, flags=re.IGNORECASE)
-            if matches:
-                replacements[term] = len(matches)
-                result = re.sub(pattern, translation, result, flags=re.IGNORECASE)
+        # 替换回调只记录命中的术语，只需一次扫描；最后由 Counter 统一计数
+        def replace(match: 're.Match[str]') -> str:
+            term = self._match_term(match.group(0))
+            matched_terms.append(term)
+            return self.glossary[term]
         
-        return result, replacements
+        result = self._get_pattern().sub(replace, text)
+        return result, dict(Counter(matched_terms))
+
+    # find_missing_terms 使用的预编译正则
+    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    CAPITALIZED_PATTERN = re.compile(r'(?<=[.!?]\s)[A-Z][a-z]+|(?<=\s)[A-Z][a-z]+')
+    ACRONYM_PATTERN = re.compile(r'\b[A-Z]{2,5}\b')
+    CAMEL_CASE_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)+\b')
+    HYPHENATED_PATTERN = re.compile(r'\b[A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*\b')
 
     # 常见英文单词，不应被识别为专业术语
     COMMON_WORDS = {
@@ -246,29 +343,30 @@ class GlossaryManager:
             return []
         
         # 移除 HTML 标签
-        clean_text = re.sub(r'<[^>]+>', ' ', text)
+        clean_text = self.HTML_TAG_PATTERN.sub(' ', text)
         
         # 查找可能的术语模式
         potential_terms: Set[str] = set()
         
         # 1. 首字母大写的单词（排除句首）
         # 匹配不在句首的大写开头单词
-        capitalized = re.findall(r'(?<=[.!?]\s)[A-Z][a-z]+|(?<=\s)[A-Z][a-z]+', clean_text)
+        capitalized = self.CAPITALIZED_PATTERN.findall(clean_text)
         potential_terms.update(capitalized)
         
         # 2. 全大写的缩写词（2-5个字母）
-        acronyms = re.findall(r'\b[A-Z]{2,5}\b', clean_text)
+        acronyms = self.ACRONYM_PATTERN.findall(clean_text)
         potential_terms.update(acronyms)
         
         # 3. 驼峰命名的词汇
-        camel_case = re.findall(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)+\b', clean_text)
+        camel_case = self.CAMEL_CASE_PATTERN.findall(clean_text)
         potential_terms.update(camel_case)
         
         # 4. 带连字符的复合词
-        hyphenated = re.findall(r'\b[A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*\b', clean_text)
+        hyphenated = self.HYPHENATED_PATTERN.findall(clean_text)
         potential_terms.update(hyphenated)
         
         # 过滤掉已在术语表中的术语和常见英文单词
+        known_terms = self._get_lower_terms()
         missing = []
         for term in potential_terms:
             term_lower = term.lower()
@@ -276,7 +374,7 @@ class GlossaryManager:
             if term_lower in self.COMMON_WORDS:
                 continue
             # 检查术语是否已存在（大小写不敏感）
-            if not any(k.lower() == term_lower for k in self.glossary.keys()):
+            if term_lower not in known_terms:
                 missing.append(term)
         
         return sorted(missing)
@@ -292,23 +390,33 @@ class GlossaryManager:
         Returns:
             List[str]: 建议的翻译列表
         """
-        suggestions = []
         term_lower = term.lower()
+        # 建议只取决于小写形式，同一术语的不同大小写共享结果
+        cached = self._suggestion_cache.get(term_lower)
+        if cached is not None:
+            return list(cached)
+        
+        suggestions = []
+        lowered_items = self._get_lowered_items()
         
         # 1. 精确匹配（大小写不敏感）
-        for key, value in self.glossary.items():
-            if key.lower() == term_lower:
+        for key_lower, _, value in lowered_items:
+            if key_lower == term_lower:
                 suggestions.append(value)
                 break
         
         # 2. 部分匹配 - 查找包含该术语的已有翻译
-        for key, value in self.glossary.items():
-            if term_lower in key.lower() and value not in suggestions:
+        for key_lower, key, value in lowered_items:
+            if len(suggestions) >= 5:
+                break  # 只返回前5个，后续结果不影响输出
+            if term_lower in key_lower and value not in suggestions:
                 suggestions.append(f"{value} (from: {key})")
-            elif key.lower() in term_lower and value not in suggestions:
+            elif key_lower in term_lower and value not in suggestions:
                 suggestions.append(f"{value} (from: {key})")
         
-        return suggestions[:5]  # 最多返回5个建议
+        suggestions = suggestions[:5]  # 最多返回5个建议
+        self._suggestion_cache[term_lower] = suggestions
+        return list(suggestions)
     
     def update_glossary(self, term: str, translation: str) -> None:
         """更新术语表
@@ -330,6 +438,7 @@ class GlossaryManager:
             key=len, 
             reverse=True
         )
+        self._clear_caches()
     
     def batch_update_glossary(self, updates: Dict[str, str]) -> int:
         """批量更新术语表
@@ -356,6 +465,7 @@ class GlossaryManager:
                 key=len, 
                 reverse=True
             )
+            self._clear_caches()
         
         return count
     
@@ -368,7 +478,7 @@ class GlossaryManager:
         self.glossary_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(self.glossary_path, 'w', encoding='utf-8') as f:
-            json.dump(sorted_glossary, f, ensure_ascii=False, indent=4)
+            dump(sorted_glossary, f, indent=4)
     
     def remove_term(self, term: str) -> bool:
         """从术语表中移除术语
@@ -387,6 +497,7 @@ class GlossaryManager:
                 key=len, 
                 reverse=True
             )
+            self._clear_caches()
             return True
         return False
     
@@ -541,15 +652,14 @@ class GlossaryManager:
         if format == "json":
             sorted_glossary = dict(sorted(self.glossary.items()))
             with open(output, 'w', encoding='utf-8') as f:
-                json.dump(sorted_glossary, f, ensure_ascii=False, indent=4)
+                dump(sorted_glossary, f, indent=4)
         
         elif format == "csv":
             import csv
             with open(output, 'w', encoding='utf-8', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(["English", "Chinese"])
-                for term, translation in sorted(self.glossary.items()):
-                    writer.writerow([term, translation])
+                writer.writerows(sorted(self.glossary.items()))
         
         elif format == "md":
             lines = [
@@ -586,17 +696,14 @@ class GlossaryManager:
         imported: Dict[str, str] = {}
         
         if suffix == ".json":
-            with open(input_file, 'r', encoding='utf-8') as f:
-                imported = json.load(f)
+            imported = load_file(input_file)
         
         elif suffix == ".csv":
             import csv
             with open(input_file, 'r', encoding='utf-8', newline='') as f:
                 reader = csv.reader(f)
                 next(reader, None)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        imported[row[0]] = row[1]
+                imported = {row[0]: row[1] for row in reader if len(row) >= 2}
         
         else:
             raise ValueError(f"Unsupported file format: {suffix}")
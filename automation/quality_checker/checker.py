@@ -1,10 +1,17 @@
 """质量检查器实现"""
 
 import re
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 from .models import Issue, QualityReport
 
 
+# 单词切分模式（用于术语表预筛选）
+_WORD_PATTERN = re.compile(r'\w+')
+
+# re.IGNORECASE 下与 ASCII 字母等价的非 ASCII 字符
+_ASCII_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+
+
 class QualityChecker:
     """翻译质量检查"""
     
@@ -12,11 +19,11 @@ class QualityChecker:
     # {0}, {1}, {name}, {{variable}}, %s, %d, etc.
     # Note: Order matters - more specific patterns should be matched first
     PLACEHOLDER_PATTERNS = [
-        (r'\{\{(\w+)\}\}', True),    # {{variable}} - double braces (match first)
-        (r'\{(\d+)\}', False),        # {0}, {1}, etc. - numeric
-        (r'\{(\w+)\}', False),        # {name}, {variable}, etc. - single braces
-        (r'%[sdifx]', False),         # %s, %d, %i, %f, %x
-        (r'%\(\w+\)[sdifx]', False),  # %(name)s, %(count)d, etc.
+        (re.compile(r'\{\{(\w+)\}\}'), True),    # {{variable}} - double braces (match first)
+        (re.compile(r'\{(\d+)\}'), False),        # {0}, {1}, etc. - numeric
+        (re.compile(r'\{(\w+)\}'), False),        # {name}, {variable}, etc. - single braces
+        (re.compile(r'%[sdifx]'), False),         # %s, %d, %i, %f, %x
+        (re.compile(r'%\(\w+\)[sdifx]'), False),  # %(name)s, %(count)d, etc.
     ]
     
     # HTML 自闭合标签
@@ -25,9 +32,12 @@ class QualityChecker:
         'base', 'col', 'embed', 'param', 'source', 'track', 'wbr'
     }
     
+    # HTML 标签模式
+    HTML_TAG_PATTERN = re.compile(r'<(/?)(\w+)([^>]*)(/?)>')
+    
     # UUID/Compendium 链接模式
-    UUID_LINK_PATTERN = r'@UUID\[([^\]]+)\](?:\{([^}]*)\})?'
-    COMPENDIUM_LINK_PATTERN = r'@Compendium\[([^\]]+)\](?:\{([^}]*)\})?'
+    UUID_LINK_PATTERN = re.compile(r'@UUID\[([^\]]+)\](?:\{([^}]*)\})?')
+    COMPENDIUM_LINK_PATTERN = re.compile(r'@Compendium\[([^\]]+)\](?:\{([^}]*)\})?')
     
     def __init__(self, location: str = ""):
         """初始化质量检查器
@@ -36,6 +46,8 @@ class QualityChecker:
             location: 当前检查位置（用于报告）
         """
         self.location = location
+        # 术语表索引缓存: (术语表对象, 条目数, 索引)
+        self._glossary_index = None
     
     def _extract_placeholders(self, text: str) -> Set[str]:
         """从文本中提取所有占位符
@@ -51,7 +63,7 @@ class QualityChecker:
         matched_positions = set()
         
         for pattern, is_double_brace in self.PLACEHOLDER_PATTERNS:
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 start, end = match.start(), match.end()
                 
                 # Check if this position overlaps with an already matched position
@@ -164,10 +176,9 @@ class QualityChecker:
         issues = []
         
         # 提取所有标签
-        tag_pattern = r'<(/?)(\w+)([^>]*)(/?)>'
         stack = []
         
-        for match in re.finditer(tag_pattern, html):
+        for match in self.HTML_TAG_PATTERN.finditer(html):
             is_closing = match.group(1) == '/'
             tag_name = match.group(2).lower()
             is_self_closing = match.group(4) == '/' or tag_name in self.SELF_CLOSING_TAGS
@@ -221,10 +232,9 @@ class QualityChecker:
         Returns:
             List[str]: 标签列表（按顺序）
         """
-        tag_pattern = r'<(/?)(\w+)([^>]*)(/?)>'
         tags = []
         
-        for match in re.finditer(tag_pattern, html):
+        for match in self.HTML_TAG_PATTERN.finditer(html):
             is_closing = match.group(1) == '/'
             tag_name = match.group(2).lower()
             is_self_closing = match.group(4) == '/' or tag_name in self.SELF_CLOSING_TAGS
@@ -250,11 +260,11 @@ class QualityChecker:
         links = set()
         
         # 提取 @UUID[...] 链接
-        for match in re.finditer(self.UUID_LINK_PATTERN, text):
+        for match in self.UUID_LINK_PATTERN.finditer(text):
             links.add(f"@UUID[{match.group(1)}]")
         
         # 提取 @Compendium[...] 链接
-        for match in re.finditer(self.COMPENDIUM_LINK_PATTERN, text):
+        for match in self.COMPENDIUM_LINK_PATTERN.finditer(text):
             links.add(f"@Compendium[{match.group(1)}]")
         
         return links
@@ -324,20 +334,69 @@ class QualityChecker:
         issues = []
         loc = location or self.location or "unknown"
         
+        if not glossary:
+            return issues
+        
+        # 按术语首个单词预筛选候选术语，只对候选术语执行正则匹配
+        by_word, always = self._get_glossary_index(glossary)
+        candidates = list(always)
+        for word in set(_WORD_PATTERN.findall(translation.translate(_ASCII_FOLD).lower())):
+            candidates.extend(by_word.get(word, ()))
+        # 按术语表顺序输出问题
+        candidates.sort()
+        
         # 检查翻译中是否包含未翻译的英文术语
-        for english_term, chinese_term in glossary.items():
-            # 使用单词边界匹配英文术语
-            pattern = r'\b' + re.escape(english_term) + r'\b'
-            if re.search(pattern, translation, re.IGNORECASE):
+        for _, english_term, pattern in candidates:
+            if pattern.search(translation):
                 issues.append(Issue(
                     severity="warning",
                     type="glossary",
-                    message=f"翻译中包含未翻译的术语 '{english_term}'，应翻译为 '{chinese_term}'",
+                    message=f"翻译中包含未翻译的术语 '{english_term}'，应翻译为 '{glossary[english_term]}'",
                     location=loc
                 ))
         
         return issues
     
+    def _get_glossary_index(
+        self, glossary: Dict[str, str]
+    ) -> Tuple[Dict[str, List[tuple]], List[tuple]]:
+        """获取术语表的预编译索引（按术语表缓存）
+        
+        缓存按术语表对象和条目数校验，不在每次调用时比较全部键；
+        原地替换术语而条目数不变时需传入新的字典。
+        每个术语的正则只编译一次。以 ASCII 单词开头的术语按首个单词（小写）
+        归类：术语能以单词边界匹配时，该单词必然完整出现在翻译中。
+        其余术语无法预筛选，每次都需要检查。
+        
+        Args:
+            glossary: 术语表 (英文 -> 中文)
+            
+        Returns:
+            (首个单词 -> [(序号, 术语, 正则)], 需始终检查的 [(序号, 术语, 正则)])
+        """
+        cached = self._glossary_index
+        if cached is not None and cached[0] is glossary and cached[1] == len(glossary):
+            return cached[2]
+        
+        by_word: Dict[str, List[tuple]] = {}
+        always: List[tuple] = []
+        for order, english_term in enumerate(glossary):
+            # 使用单词边界匹配英文术语
+            entry = (
+                order,
+                english_term,
+                re.compile(r'\b' + re.escape(english_term) + r'\b', re.IGNORECASE),
+            )
+            match = _WORD_PATTERN.match(english_term)
+            if match and match.group().isascii():
+                by_word.setdefault(match.group().lower(), []).append(entry)
+            else:
+                always.append(entry)
+        
+        index = (by_word, always)
+        self._glossary_index = (glossary, len(glossary), index)
+        return index
+    
     def check_all(
         self, 
         source: str, 
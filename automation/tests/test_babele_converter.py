@@ -17,6 +17,9 @@ from automation.babele_converter import (
     TranslationCache,
 )
 from automation.babele_converter.converter import (
+    _json_clone,
+    build_pack_index,
+    count_compendium_reuse,
     safe_merge,
     translate_actions,
     get_all_translatable_fields,
@@ -579,6 +582,50 @@ class TestEmbeddedItemsTranslation:
                 assert translated.get("_translationSource") == "compendium-reuse", \
                     f"Item {i} should be marked as compendium-reuse"
 
+    
+    def test_embedded_items_reuse_respects_pack_priority_and_exclusion(self):
+        """
+        Property: Earlier packs win, and the current pack is never reused.
+        
+        Feature: translation-automation-workflow, Property: Pack reuse
+        **Validates: Requirements 4.1, 4.2**
+        """
+        current = {"translated": True, "translations": {"Fighting": {"name": "自身"}}}
+        first = {"translated": True, "translations": {"Fighting": {"name": "格斗"}}}
+        second = {"translated": True, "translations": {"Fighting": {"name": "战斗"}}}
+        
+        items = [{"_id": "a", "name": "Fighting", "type": "skill"}]
+        result = translate_embedded_items(items, {}, [current, first, second], current)
+        
+        assert result[0]["name"] == "格斗"
+        assert result[0]["_translationSource"] == "compendium-reuse"
+
+    
+    @given(
+        items=st.lists(simple_item_strategy, min_size=0, max_size=5),
+        packs=st.lists(translation_pack_strategy, min_size=1, max_size=3)
+    )
+    @settings(max_examples=100, deadline=5000)
+    @pytest.mark.property
+    def test_count_compendium_reuse_matches_translation(self, items, packs):
+        """
+        Property: count_compendium_reuse agrees with the items marked by translation.
+        
+        Feature: translation-automation-workflow, Property: Pack reuse
+        **Validates: Requirements 4.1, 4.2**
+        """
+        for item in items[:2]:
+            packs[0]["translations"][item["name"]] = {"name": f"复用_{item['name']}"}
+        
+        pack_index = build_pack_index(packs)
+        translated = translate_embedded_items(items, {}, packs, pack_index=pack_index)
+        expected = sum(
+            1 for item in translated
+            if item.get("_translationSource") == "compendium-reuse"
+        )
+        
+        assert count_compendium_reuse(items, pack_index) == expected
+
 
 class TestTranslationCache:
     """翻译缓存测试"""
@@ -709,3 +756,29 @@ class TestSafeMerge:
         
         # Top-level original field should be preserved
         assert result["name"] == original["name"]
+
+
+class TestJsonClone:
+    """JSON 数据克隆测试"""
+    
+    @given(obj=nested_content_strategy())
+    @settings(max_examples=100, deadline=5000)
+    @pytest.mark.property
+    def test_json_clone_matches_deepcopy(self, obj):
+        """
+        Property: _json_clone should produce an equal, fully independent copy.
+        
+        Feature: translation-automation-workflow, Property: Clone equivalence
+        **Validates: Requirements 4.1, 4.2**
+        """
+        original = copy.deepcopy(obj)
+        result = _json_clone(obj)
+        
+        assert result == original
+        
+        # Mutating the clone must not leak into the source
+        if isinstance(result, dict):
+            result.clear()
+        elif isinstance(result, list):
+            result.append("mutated")
+        assert obj == original
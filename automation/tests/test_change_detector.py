@@ -28,6 +28,18 @@ entries_strategy = st.dictionaries(
     max_size=20
 )
 
+# Strategy for entries whose values differ only in JSON number/bool type
+# (1, 1.0 and true compare equal in Python but are different JSON values)
+scalar_entries_strategy = st.dictionaries(
+    keys=st.sampled_from(["a", "b", "c", "d"]),
+    values=st.fixed_dictionaries({
+        "name": st.sampled_from(["x", "y"]),
+        "rank": st.sampled_from([0, 1, 0.0, 1.0, True, False]),
+    }),
+    min_size=0,
+    max_size=4
+)
+
 
 class TestChangeDetectorProperties:
     """Change Detector 属性测试"""
@@ -177,6 +189,75 @@ class TestChangeDetectorProperties:
         assert all_reported == all_keys, \
             f"Reported entries should cover all keys: expected {all_keys}, got {all_reported}"
 
+    
+    @given(
+        old_entries=st.one_of(entries_strategy, scalar_entries_strategy),
+        new_entries=st.one_of(entries_strategy, scalar_entries_strategy)
+    )
+    @settings(max_examples=100, deadline=5000)
+    @pytest.mark.property
+    def test_compare_files_matches_compare_entries(self, old_entries, new_entries):
+        """
+        Property: compare_files should report the same changes as compare_entries.
+        
+        Feature: translation-automation-workflow, Property: File comparison
+        **Validates: Requirements 1.2, 8.1**
+        """
+        import json
+        import tempfile
+        from pathlib import Path
+        
+        detector = ChangeDetector()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_file = Path(tmpdir) / "old.json"
+            new_file = Path(tmpdir) / "new.json"
+            old_file.write_text(json.dumps({"entries": old_entries}), encoding='utf-8')
+            new_file.write_text(json.dumps({"entries": new_entries}), encoding='utf-8')
+            
+            copy_file = Path(tmpdir) / "copy.json"
+            copy_file.write_bytes(new_file.read_bytes())
+            
+            report = detector.compare_files(str(old_file), str(new_file))
+            missing_old = detector.compare_files("", str(new_file))
+            identical = detector.compare_files(str(copy_file), str(new_file))
+        
+        expected = detector.compare_entries(old_entries, new_entries)
+        assert report.file_name == "new.json"
+        assert report.added_entries == expected.added_entries
+        assert report.modified_entries == expected.modified_entries
+        assert report.deleted_entries == expected.deleted_entries
+        assert set(report.unchanged_entries) == set(expected.unchanged_entries)
+        
+        # 1 -> 1.0 or true -> 1 is a source change even though Python compares them equal
+        assert report.modified_entries == sorted(
+            key for key in old_entries.keys() & new_entries.keys()
+            if json.dumps(old_entries[key], sort_keys=True)
+            != json.dumps(new_entries[key], sort_keys=True)
+        )
+        
+        assert missing_old.added_entries == sorted(new_entries.keys())
+        assert not identical.has_changes
+        assert sorted(identical.unchanged_entries) == sorted(new_entries.keys())
+
+    
+    def test_compare_files_same_size_different_content(self, tmp_path):
+        """Files of equal size but different content are still fully compared."""
+        import json
+        
+        old_file = tmp_path / "old.json"
+        new_file = tmp_path / "new.json"
+        old_file.write_text(json.dumps({"entries": {"A": {"name": "x"}, "B": {"name": "y"}}}))
+        new_file.write_text(json.dumps({"entries": {"A": {"name": "z"}, "C": {"name": "y"}}}))
+        assert old_file.stat().st_size == new_file.stat().st_size
+        
+        report = ChangeDetector().compare_files(str(old_file), str(new_file))
+        
+        assert report.added_entries == ["C"]
+        assert report.modified_entries == ["A"]
+        assert report.deleted_entries == ["B"]
+        assert report.unchanged_entries == []
+
 
 
 class TestPlaceholderFileCreation:
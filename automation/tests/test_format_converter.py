@@ -424,6 +424,24 @@ class TestHTMLTextExtractor:
         normalized_text = ' '.join(text.split())
         assert normalized_text in extracted or extracted in normalized_text
 
+    @given(parts=st.lists(st.sampled_from([
+        '<p>', '</p>', '<br/>', '<br />', '<P class="a">', '<span id=x >',
+        '</span >', '<h1>', '</h1>', '<em/>', '<li>', '</li>', '<style>',
+        '&amp;', '<!-- c -->', ' ', '\n', 'ab', 'c d', '>', '<',
+    ]), max_size=12))
+    @settings(max_examples=300, deadline=5000)
+    @pytest.mark.property
+    def test_simple_fast_path_matches_parser(self, parts):
+        """The regex fast path gives the same text as HTMLParser or declines"""
+        from automation.format_converter.converter import _simple_html_to_text
+
+        html = ''.join(parts)
+        fast = _simple_html_to_text(html)
+        if fast is not None:
+            extractor = HTMLTextExtractor()
+            extractor.feed(html)
+            assert fast == extractor.get_text()
+
 
 # ============================================================================
 # Property 3: Link Preservation Tests (extract → inject round-trip)
@@ -565,3 +583,141 @@ class TestUUIDLinkPreservation:
 
         assert set(original_links) == set(result_links), \
             f"UUID links with display text changed: {original_links} -> {result_links}"
+
+    def test_repeated_placeholder_assigned_to_every_paragraph(self):
+        """A placeholder occurring in several paragraphs is kept in each of them."""
+        converter = FormatConverter()
+        paragraphs = [
+            ('<p>', 'A [[LINK_0]] b', '</p>'),
+            ('<p>', 'plain', '</p>'),
+            ('<p>', '[[LINK_1]] c [[LINK_0]] [[LINK_0]]', '</p>'),
+        ]
+        placeholder_map = {'[[LINK_0]]': {}, '[[LINK_1]]': {}}
+
+        assignments = converter._assign_placeholders_to_paragraphs(paragraphs, placeholder_map)
+
+        assert assignments == {
+            0: ['[[LINK_0]]'],
+            2: ['[[LINK_0]]', '[[LINK_0]]', '[[LINK_1]]'],
+        }
+
+
+class TestTranslationsCache:
+    """inject 翻译文件解析缓存测试"""
+    
+    def test_cached_translations_match_fresh_parse(self, temp_dir, monkeypatch):
+        """A cached parse equals a fresh parse and is invalidated by edits."""
+        from automation.format_converter import __main__ as cli
+        
+        monkeypatch.setattr(cli, 'CACHE_DIR', temp_dir / 'cache')
+        converter = FormatConverter()
+        csv_path = temp_dir / 'edges.csv'
+        csv_path.write_text(
+            '\ufeffkey,field,source_text,translated_text,context\n'
+            'Alertness,name,Alertness,警觉,\n',
+            encoding='utf-8'
+        )
+        
+        first = cli._load_translations_cached(converter, str(csv_path))
+        assert len(list((temp_dir / 'cache').glob('*.pkl'))) == 1
+        assert cli._load_translations_cached(converter, str(csv_path)) == first
+        assert first == converter.load_translations(str(csv_path))
+        
+        csv_path.write_text(
+            '\ufeffkey,field,source_text,translated_text,context\n'
+            'Alertness,name,Alertness,机警的人,\n',
+            encoding='utf-8'
+        )
+        assert cli._load_translations_cached(converter, str(csv_path)) == \
+            {'Alertness': {'name': '机警的人'}}
+    
+    def test_broken_cache_files_are_reparsed_and_pruned(self, temp_dir, monkeypatch):
+        """Unreadable cache files fall back to parsing; old entries are pruned."""
+        from automation.format_converter import __main__ as cli
+        
+        cache_dir = temp_dir / 'cache'
+        monkeypatch.setattr(cli, 'CACHE_DIR', cache_dir)
+        monkeypatch.setattr(cli, '_CACHE_MAX_FILES', 2)
+        converter = FormatConverter()
+        
+        paths = []
+        for i in range(3):
+            csv_path = temp_dir / f'pack{i}.csv'
+            csv_path.write_text(
+                '\ufeffkey,field,source_text,translated_text,context\n'
+                f'Entry{i},name,Entry,条目{i},\n',
+                encoding='utf-8'
+            )
+            paths.append(str(csv_path))
+            cli._load_translations_cached(converter, paths[-1])
+        assert len(list(cache_dir.glob('*.pkl'))) == 2
+        
+        # A pickle of a class that no longer exists raises AttributeError on load
+        cache_file = cache_dir / f'{cli._translations_cache_key(paths[-1])}.pkl'
+        cache_file.write_bytes(b'\x80\x04\x95\x13\x00\x00\x00\x00\x00\x00\x00'
+                               b'\x8c\x08builtins\x94\x8c\x04nope\x94\x93\x94.')
+        assert cli._load_translations_cached(converter, paths[-1]) == \
+            {'Entry2': {'name': '条目2'}}
+
+
+class TestInjectTranslationsToData:
+    """inject_translations_to_data 写时复制测试"""
+    
+    def test_source_data_not_modified(self):
+        """Injection only copies what it writes and never mutates the source."""
+        import copy
+        
+        source = {
+            "label": "Edges",
+            "entries": {
+                "Alertness": {
+                    "name": "Alertness",
+                    "description": "<p>Not easily surprised.</p>",
+                    "actions": {"additional": {"roll": {"name": "Roll"}}},
+                },
+                "Ambidextrous": {"name": "Ambidextrous"},
+            },
+        }
+        snapshot = copy.deepcopy(source)
+        translations = {
+            "Alertness": {
+                "name": "警觉",
+                "description": "不容易被惊吓。",
+                "actions.additional.roll.name": "检定",
+                "actions.missing.path.name": "无",
+            },
+        }
+        
+        result = FormatConverter().inject_translations_to_data(source, translations)
+        
+        assert source == snapshot
+        alertness = result["entries"]["Alertness"]
+        assert alertness["name"] == "警觉"
+        assert alertness["description"] == "<p>不容易被惊吓。</p>"
+        assert alertness["actions"]["additional"]["roll"]["name"] == "检定"
+        assert "missing" not in alertness["actions"]
+        assert result["entries"]["Ambidextrous"] == {"name": "Ambidextrous"}
+        assert result["label"] == "Edges"
+
+
+class TestParallelExtraction:
+    """extract_entries 进程池提取测试"""
+    
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Chunked extraction in worker processes keeps entries and order."""
+        from automation.format_converter import converter as converter_module
+        
+        monkeypatch.setattr(converter_module, 'PARALLEL_MIN_ENTRIES', 2)
+        data = {
+            "entries": {
+                f"Edge {i}": {
+                    "name": f"Edge {i}",
+                    "description": f"<p>See @UUID[Compendium.x.{i}]{{Rule {i}}} here.</p>",
+                    "actions": {"additional": {"roll": {"name": f"Roll {i}"}}},
+                }
+                for i in range(7)
+            }
+        }
+        converter = FormatConverter()
+        
+        assert converter.extract_entries(data, jobs=3) == converter.extract_entries(data)
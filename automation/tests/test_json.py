@@ -0,0 +1,98 @@
+"""JSON 辅助模块测试
+
+验证 orjson 与标准库 json 两条路径的行为一致
+"""
+
+import json
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from automation import _json
+
+
+json_value_strategy = st.recursive(
+    st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(min_value=-(2**53), max_value=2**53),
+        st.text(max_size=20),
+    ),
+    lambda children: st.one_of(
+        st.lists(children, max_size=5),
+        st.dictionaries(st.text(max_size=10), children, max_size=5),
+    ),
+    max_leaves=20,
+)
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    """Run a test against both the orjson and the stdlib backend."""
+    if request.param and not _json.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, 'HAS_ORJSON', request.param)
+    return request.param
+
+
+class TestJsonHelpers:
+    """JSON 辅助函数测试"""
+    
+    @given(value=json_value_strategy)
+    @settings(max_examples=100, deadline=5000)
+    @pytest.mark.property
+    def test_roundtrip_matches_stdlib(self, value):
+        """
+        Property: dumps/loads should round-trip to the same object as stdlib json.
+        """
+        assert _json.loads(_json.dumps(value)) == value
+        assert _json.loads(_json.dumps(value, indent=2).encode('utf-8')) == value
+        assert _json.loads(json.dumps(value)) == value
+    
+    def test_load_file_preserves_unicode(self, backend, temp_dir):
+        """Files are read as UTF-8 and non-ASCII text is kept verbatim."""
+        path = temp_dir / "test.json"
+        data = {"entries": {"Alertness": {"name": "警觉"}}}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        
+        assert _json.load_file(path) == data
+        assert "警觉" in _json.dumps(data, indent=2)
+    
+    def test_load_file_large_file(self, backend, temp_dir):
+        """Files above the mmap threshold load the same as small ones."""
+        path = temp_dir / "large.json"
+        data = {"entries": {f"Entry {i}": {"name": f"条目 {i}"} for i in range(5000)}}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        assert path.stat().st_size > _json.MMAP_THRESHOLD
+        
+        assert _json.load_file(path) == data
+    
+    def test_dumps_indent_width(self, backend):
+        """Non-default indent widths are honoured."""
+        data = {"entries": {"a": 1}}
+        
+        assert _json.dumps(data, indent=4) == json.dumps(data, ensure_ascii=False, indent=4)
+        assert _json.dumps(data, indent=2) == json.dumps(data, ensure_ascii=False, indent=2)
+    
+    def test_sort_keys(self, backend):
+        """sort_keys produces key-ordered output."""
+        assert _json.dumps({"b": 1, "a": 2}, sort_keys=True).index('"a"') < \
+            _json.dumps({"b": 1, "a": 2}, sort_keys=True).index('"b"')
+    
+    def test_dump_matches_dumps(self, backend):
+        """dump writes the same text as dumps for every indent width."""
+        import io
+        data = {"entries": {"Alertness": {"name": "警觉", "tags": [1, 2]}}}
+        
+        for indent in (None, 2, 4):
+            out = io.StringIO()
+            _json.dump(data, out, indent=indent)
+            assert out.getvalue() == _json.dumps(data, indent=indent)
+    
+    def test_dumps_bytes_matches_dumps(self, backend):
+        """dumps_bytes returns the UTF-8 encoding of the compact dumps output."""
+        data = {"b": [1, 2], "a": "警觉", "big": 2**70}
+        
+        assert _json.dumps_bytes(data, sort_keys=True) == \
+            _json.dumps(data, sort_keys=True).encode('utf-8')
+        assert _json.loads(_json.dumps_bytes(data)) == data
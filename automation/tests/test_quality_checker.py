@@ -5,6 +5,8 @@ Property 10: Placeholder Detection
 Validates: Requirements 7.1, 7.2
 """
 
+import re
+
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 
@@ -302,3 +304,43 @@ class TestHTMLTagBalance:
         # Should have no errors for self-closing tags
         errors = [i for i in issues if i.severity == "error"]
         assert len(errors) == 0, f"Self-closing tag '<{self_closing_tag}>' should not cause errors"
+
+
+# ============================================================================
+# Glossary Consistency Tests
+# ============================================================================
+
+glossary_term_strategy = st.sampled_from([
+    'Edge', 'Hindrance', 'Arcane Background', 'arcane', 'Fighting',
+    'Fighting Skill', 'd6', '+2', 'Mr.Smith', 'Straße', 'İstanbul'
+])
+
+
+class TestGlossaryConsistency:
+    """术语一致性检查测试"""
+    
+    @given(
+        terms=st.lists(glossary_term_strategy, unique=True),
+        parts=st.lists(st.one_of(
+            glossary_term_strategy,
+            st.sampled_from([' ', '，', '技能', 'EDGE', 'edges', 'ıstanbul', 'ſkill', 'x'])
+        ), max_size=10)
+    )
+    @settings(max_examples=200, deadline=5000)
+    @pytest.mark.property
+    def test_glossary_index_matches_per_term_search(self, terms, parts):
+        """
+        Property: The indexed glossary check reports exactly the terms a
+        per-term word-boundary search finds, in glossary order.
+        """
+        glossary = dict.fromkeys(terms, '术语')
+        translation = ''.join(parts)
+        expected = [
+            term for term in glossary
+            if re.search(r'\b' + re.escape(term) + r'\b', translation, re.IGNORECASE)
+        ]
+        
+        checker = QualityChecker()
+        for _ in range(2):  # second run uses the cached index
+            issues = checker.check_glossary_consistency(translation, glossary, "test.entry")
+            assert [i.message.split("'")[1] for i in issues] == expected
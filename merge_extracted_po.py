@@ -124,14 +124,31 @@ def parse_po_file(filepath):
     return header_lines, entries
 
 
+# Single-pass escape table for escape_po_string
+PO_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\t': '\\t'})
+
+
 def escape_po_string(text):
     """Escape special characters for PO format."""
     if not text:
         return ""
-    text = text.replace('\\', '\\\\')
-    text = text.replace('"', '\\"')
-    text = text.replace('\t', '\\t')
-    return text
+    return text.translate(PO_ESCAPE_TABLE)
+
+
+def write_po_field(write, keyword, text):
+    """Write a msgid/msgstr field, using the multiline form when text has newlines."""
+    if '\n' in text:
+        write(keyword)
+        write(' ""\n')
+        for line in text.split('\n'):
+            write('"')
+            write(escape_po_string(line))
+            write('\\n"\n')
+    else:
+        write(keyword)
+        write(' "')
+        write(escape_po_string(text))
+        write('"\n')
 
 
 def merge_extracted_po_files(chinese_file, english_file, output_file):
@@ -146,51 +163,42 @@ def merge_extracted_po_files(chinese_file, english_file, output_file):
     print(f"Chinese entries: {len(chinese_entries)}")
     print(f"English entries: {len(english_entries)}")
     
-    # Create merged content
-    merged_lines = []
-    
-    # Use Chinese header (but could use either)
-    merged_lines.extend(chinese_header)
-    merged_lines.append('')
-    
-    # Process all entries from English file (which has the complete structure)
+    # Write merged content straight to the output file
     matched_count = 0
-    for msgctxt, english_entry in english_entries.items():
-        # Add comments from English file
-        for comment in english_entry['comments']:
-            merged_lines.append(comment)
-        
-        # Add msgctxt
-        merged_lines.append(f'msgctxt "{escape_po_string(msgctxt)}"')
+    with open(output_file, 'w', encoding='utf-8') as f:
+        write = f.write
         
-        # Add msgid (English source text)
-        if '\n' in english_entry['msgid']:
-            merged_lines.append('msgid ""')
-            for line in english_entry['msgid'].split('\n'):
-                merged_lines.append(f'"{escape_po_string(line)}\\n"')
-        else:
-            merged_lines.append(f'msgid "{escape_po_string(english_entry["msgid"])}"')
+        # Use Chinese header (but could use either)
+        for line in chinese_header:
+            write(line)
+            write('\n')
+        write('\n')
         
-        # Add msgstr (Chinese translation from Chinese file)
-        if msgctxt in chinese_entries and chinese_entries[msgctxt]['msgid']:
-            # The Chinese translation is in the msgid field of the Chinese file
-            chinese_text = chinese_entries[msgctxt]['msgid']
-            if '\n' in chinese_text:
-                merged_lines.append('msgstr ""')
-                for line in chinese_text.split('\n'):
-                    merged_lines.append(f'"{escape_po_string(line)}\\n"')
+        # Process all entries from English file (which has the complete structure)
+        for msgctxt, english_entry in english_entries.items():
+            # Add comments from English file
+            for comment in english_entry['comments']:
+                write(comment)
+                write('\n')
+            
+            # Add msgctxt
+            write('msgctxt "')
+            write(escape_po_string(msgctxt))
+            write('"\n')
+            
+            # Add msgid (English source text)
+            write_po_field(write, 'msgid', english_entry['msgid'])
+            
+            # Add msgstr (Chinese translation from Chinese file)
+            chinese_entry = chinese_entries.get(msgctxt)
+            if chinese_entry and chinese_entry['msgid']:
+                # The Chinese translation is in the msgid field of the Chinese file
+                write_po_field(write, 'msgstr', chinese_entry['msgid'])
+                matched_count += 1
             else:
-                merged_lines.append(f'msgstr "{escape_po_string(chinese_text)}"')
-            matched_count += 1
-        else:
-            merged_lines.append('msgstr ""')
-        
-        merged_lines.append('')
-    
-    # Write merged file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for line in merged_lines:
-            f.write(line + '\n')
+                write('msgstr ""\n')
+            
+            write('\n')
     
     print(f"Merged file written to: {output_file}")
     print(f"Total entries processed: {len(english_entries)}")